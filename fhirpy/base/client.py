@@ -1,6 +1,7 @@
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TypeVar, Union
 
 from yarl import URL
@@ -137,6 +138,10 @@ class AbstractClient(ABC):
         return headers
 
     def _build_request_url(self, path, params) -> str:
+        base_url, base_url_path, is_base_url_absolute = _parse_base_url(self.url)
+        # Pagination links usually start with the base url, so they are returned without parsing
+        if is_base_url_absolute and path.startswith(self.url):
+            return path
         if URL(path).is_absolute():
             if self.url in path:
                 return path
@@ -145,11 +150,25 @@ class AbstractClient(ABC):
                 " (possible security issue)"
             )
         path = path.lstrip("/")
-        base_url_path = URL(self.url.rstrip("/")).path.lstrip("/") + "/"
         path = remove_prefix(path, base_url_path)
         params = params or {}
 
-        return f'{self.url.rstrip("/")}/{path.lstrip("/")}?{encode_params(params)}'
+        return f'{base_url}/{path.lstrip("/")}?{encode_params(params)}'
+
+
+@lru_cache(maxsize=16)
+def _parse_base_url(url: str) -> tuple[str, str, bool]:
+    """
+    Returns base url without trailing slash, its path prefix and whether it's absolute,
+    the result is cached per url because it's needed for every request
+
+    >>> _parse_base_url("http://example.com/fhir/")
+    ('http://example.com/fhir', 'fhir/', True)
+    """
+    base_url = url.rstrip("/")
+    parsed_base_url = URL(base_url)
+
+    return base_url, parsed_base_url.path.lstrip("/") + "/", parsed_base_url.is_absolute()
 
 
 TClient = TypeVar("TClient", bound=AbstractClient)
@@ -1,11 +1,13 @@
-import copy
+import asyncio
 import json
 import warnings
 from abc import ABC
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from typing import Any, Generic, Literal, TypeVar, Union, cast, overload
 
 import aiohttp
+from typing_extensions import Self
 
 from fhirpy.base.client import AbstractClient
 from fhirpy.base.exceptions import MultipleResourcesFound, OperationOutcome, ResourceNotFound
@@ -17,13 +19,16 @@ from fhirpy.base.resource_protocol import (
     get_resource_type_id_and_class,
 )
 from fhirpy.base.searchset import AbstractSearchSet
-from fhirpy.base.utils import AttrDict, get_by_path, parse_pagination_url
+from fhirpy.base.utils import AttrDict, get_by_path, json_dumps, parse_pagination_url
 
 
 class AsyncClient(AbstractClient, ABC):
     aiohttp_config: dict
+    connector_config: dict
+    _session: Union[aiohttp.ClientSession, None]
+    _session_loop: Union[asyncio.AbstractEventLoop, None]
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: str,
         authorization: Union[str, None] = None,
@@ -31,11 +36,53 @@ class AsyncClient(AbstractClient, ABC):
         aiohttp_config: Union[dict, None] = None,
         *,
         dump_resource: Callable[[Any], dict] = lambda x: dict(x),
+        connector_config: Union[dict, None] = None,
     ):
         self.aiohttp_config = aiohttp_config or {}
+        self.connector_config = connector_config or {}
+        self._session = None
+        self._session_loop = None
 
         super().__init__(url, authorization, extra_headers, dump_resource=dump_resource)
 
+    async def __aenter__(self) -> Self:
+        # Connections are kept alive and reused between requests until the client is exited
+        if self._session is None:
+            self._session = self._create_session()
+            self._session_loop = asyncio.get_running_loop()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the underlying keep-alive connections of the client
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(**self.connector_config))
+
+    @asynccontextmanager
+    async def _open_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self._session is None:
+            # Outside of `async with client` every request uses its own session
+            async with self._create_session() as session:
+                yield session
+            return
+
+        # aiohttp session is bound to the event loop it's created in
+        if self._session_loop is not asyncio.get_running_loop():
+            raise RuntimeError(
+                "The client session was opened in another event loop, "
+                "use `async with client` inside the loop the requests are made from"
+            )
+        yield self._session
+
     async def execute(
         self,
         path,
@@ -115,13 +162,16 @@ class AsyncClient(AbstractClient, ABC):
         # _as_dict is a private api used internally
         _as_dict: bool = False,
     ) -> Union[TResource, dict]:
-        data = serialize(self.dump_resource(resource), drop_nulls_from_dicts=fields is None)
         if fields:
             if not resource.id:
                 raise TypeError("Resource `id` is required for update operation")
+            # Only the requested fields are serialized, missing or empty ones raise KeyError
+            dumped = self.dump_resource(resource)
+            data = serialize({key: dumped[key] for key in fields}, drop_nulls_from_dicts=False)
             data = {key: data[key] for key in fields}
             method = "patch"
         else:
+            data = serialize(self.dump_resource(resource))
             method = "put" if resource.id else "post"
 
         response_data = await self._do_request(
@@ -231,28 +281,41 @@ class AsyncClient(AbstractClient, ABC):
         returning_status=False,
     ) -> Union[Any, tuple[Any, int]]:
         headers = self._build_request_headers()
+        request_config = self.aiohttp_config
+        if "headers" in request_config:
+            # Headers from the config take precedence over the client ones
+            request_config = dict(request_config)
+            headers = {**headers, **request_config.pop("headers")}
         url = self._build_request_url(path, params)
-        async with aiohttp.ClientSession(headers=headers) as session:
-            async with session.request(method, url, json=data, **self.aiohttp_config) as r:
-                if 200 <= r.status < 300:  # noqa: PLR2004
-                    raw_data = await r.text()
-                    r_data = json.loads(raw_data, object_hook=AttrDict) if raw_data else None
-                    return (r_data, r.status) if returning_status else r_data
-
-                if r.status in (404, 410):
-                    raise ResourceNotFound(await r.text())
-
-                if r.status == 412:  # noqa: PLR2004
-                    raise MultipleResourcesFound(await r.text())
-
-                raw_data = await r.text()
-                try:
-                    parsed_data = json.loads(raw_data)
-                    if parsed_data["resourceType"] == "OperationOutcome":
-                        raise OperationOutcome(resource=parsed_data)
-                    raise OperationOutcome(reason=raw_data)
-                except (KeyError, json.JSONDecodeError) as exc:
-                    raise OperationOutcome(reason=raw_data) from exc
+        body = None
+        if data is not None:
+            # Header names are case-insensitive, a user-provided one is kept as is
+            if not any(key.lower() == "content-type" for key in headers):
+                headers["Content-Type"] = "application/json"
+            body = json_dumps(data)
+        async with self._open_session() as session, session.request(
+            method, url, data=body, headers=headers, **request_config
+        ) as r:
+            if 200 <= r.status < 300:  # noqa: PLR2004
+                # json.loads accepts bytes, so the text decoding step is skipped
+                content = await r.read()
+                r_data = json.loads(content, object_hook=AttrDict) if content else None
+                return (r_data, r.status) if returning_status else r_data
+
+            if r.status in (404, 410):
+                raise ResourceNotFound(await r.text())
+
+            if r.status == 412:  # noqa: PLR2004
+                raise MultipleResourcesFound(await r.text())
+
+            raw_data = await r.text()
+            try:
+                parsed_data = json.loads(raw_data)
+                if parsed_data["resourceType"] == "OperationOutcome":
+                    raise OperationOutcome(resource=parsed_data)
+                raise OperationOutcome(reason=raw_data)
+            except (KeyError, json.JSONDecodeError) as exc:
+                raise OperationOutcome(reason=raw_data) from exc
 
     async def _fetch_resource(self, path, params=None):
         return await self._do_request("get", path, params=params)
@@ -266,6 +329,8 @@ class AsyncResource(
     BaseResource[TAsyncClient, TResource, TReference],
     ABC,
 ):
+    __slots__ = ()
+
     async def save(
         self, fields: Union[list[str], None] = None, search_params: Union[dict, None] = None
     ) -> TResource:
@@ -347,6 +412,8 @@ class AsyncReference(
     BaseReference[TAsyncClient, TResource, TReference],
     ABC,
 ):
+    __slots__ = ()
+
     async def to_resource(self) -> TResource:
         """
         Returns Resource instance for this reference
@@ -427,6 +494,10 @@ class AsyncSearchSet(
                 stacklevel=2,
             )
             searchset = searchset.search(_id=id)
+        resource_id = self._get_id_for_read(searchset.params)
+        if resource_id:
+            resource_data = await self.client._fetch_resource(f"{self.resource_type}/{resource_id}")
+            return self._dict_to_resource(resource_data)
         res_data = await searchset.fetch()
         if len(res_data) == 0:
             raise ResourceNotFound("No resources found")
@@ -435,16 +506,15 @@ class AsyncSearchSet(
         return res_data[0]
 
     async def count(self) -> int:
-        new_params = copy.deepcopy(self.params)
-        new_params["_count"] = 0
-        new_params["_totalMethod"] = "count"
+        new_params = {**self.params, "_count": 0, "_totalMethod": "count"}
 
         return (await self.client._fetch_resource(self.resource_type, params=new_params))["total"]
 
     async def first(self) -> Union[TResource, None]:
-        result = await self.limit(1).fetch()
+        searchset = self.limit(1)
+        bundle_data = await self.client._fetch_resource(self.resource_type, searchset.params)
 
-        return result[0] if result else None
+        return next(self._iter_bundle_resources(bundle_data), None)
 
     async def get_or_create(self, resource: TResource) -> tuple[TResource, bool]:
         assert resource.resourceType == self.resource_type
@@ -493,17 +563,33 @@ class AsyncSearchSet(
         )
 
     async def __aiter__(self) -> AsyncGenerator[TResource, None]:
-        next_link = None
-        while True:
-            if next_link:
-                bundle_data = await self.client._fetch_resource(*parse_pagination_url(next_link))
-            else:
-                bundle_data = await self.client._fetch_resource(self.resource_type, self.params)
-            new_resources = self._get_bundle_resources(bundle_data)
-            next_link = get_by_path(bundle_data, ["link", {"relation": "next"}, "url"])
-
-            for item in new_resources:
-                yield item
-
-            if not next_link:
-                break
+        bundle_data = await self.client._fetch_resource(self.resource_type, self.params)
+        next_page = None
+        try:
+            while True:
+                next_link = get_by_path(bundle_data, ["link", {"relation": "next"}, "url"])
+
+                for item in self._iter_bundle_resources(bundle_data):
+                    yield item
+                    # The consumer asks for more items, so the next page is requested
+                    # while the rest of the current one is being consumed
+                    if next_link and next_page is None:
+                        next_page = asyncio.ensure_future(
+                            self.client._fetch_resource(*parse_pagination_url(next_link))
+                        )
+
+                if not next_link:
+                    break
+                if next_page is None:
+                    # The page has no items
+                    bundle_data = await self.client._fetch_resource(
+                        *parse_pagination_url(next_link)
+                    )
+                else:
+                    bundle_data = await next_page
+                    next_page = None
+        finally:
+            # Iteration stopped early, so the prefetched page is not needed
+            if next_page is not None and not next_page.cancel() and not next_page.cancelled():
+                # The page is already fetched, its error (if any) is marked as retrieved
+                next_page.exception()
@@ -1,11 +1,12 @@
-import copy
 import json
 import warnings
 from abc import ABC
 from collections.abc import Callable, Generator
+from http.cookiejar import DefaultCookiePolicy
 from typing import Any, Generic, Literal, TypeVar, Union, cast, overload
 
 import requests
+from typing_extensions import Self
 
 from fhirpy.base.client import AbstractClient
 from fhirpy.base.exceptions import MultipleResourcesFound, OperationOutcome, ResourceNotFound
@@ -17,13 +18,15 @@ from fhirpy.base.resource_protocol import (
     get_resource_type_id_and_class,
 )
 from fhirpy.base.searchset import AbstractSearchSet
-from fhirpy.base.utils import AttrDict, get_by_path, parse_pagination_url
+from fhirpy.base.utils import AttrDict, get_by_path, json_dumps, parse_pagination_url
 
 
 class SyncClient(AbstractClient, ABC):
     requests_config: dict
+    _session: requests.Session
+    _owns_session: bool
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: str,
         authorization: Union[str, None] = None,
@@ -31,11 +34,32 @@ class SyncClient(AbstractClient, ABC):
         requests_config: Union[dict, None] = None,
         *,
         dump_resource: Callable[[Any], dict] = lambda x: dict(x),
+        session: Union[requests.Session, None] = None,
     ):
         self.requests_config = requests_config or {}
+        # The passed session is owned by the caller and isn't closed by the client
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            # Cookies set by the server aren't kept, so requests stay independent of each other
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._session = session
 
         super().__init__(url, authorization, extra_headers, dump_resource=dump_resource)
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying keep-alive connections of the client
+        """
+        if self._owns_session:
+            self._session.close()
+
     def execute(
         self,
         path: str,
@@ -113,13 +137,16 @@ class SyncClient(AbstractClient, ABC):
         # _as_dict is a private api used internally
         _as_dict: bool = False,
     ) -> Union[TResource, dict]:
-        data = serialize(self.dump_resource(resource), drop_nulls_from_dicts=fields is None)
         if fields:
             if not resource.id:
                 raise TypeError("Resource `id` is required for update operation")
+            # Only the requested fields are serialized, missing or empty ones raise KeyError
+            dumped = self.dump_resource(resource)
+            data = serialize({key: dumped[key] for key in fields}, drop_nulls_from_dicts=False)
             data = {key: data[key] for key in fields}
             method = "patch"
         else:
+            data = serialize(self.dump_resource(resource))
             method = "put" if resource.id else "post"
 
         response_data = self._do_request(
@@ -230,7 +257,13 @@ class SyncClient(AbstractClient, ABC):
     ) -> Union[tuple[Any, int], Any]:
         headers = self._build_request_headers()
         url = self._build_request_url(path, params)
-        r = requests.request(method, url, json=data, headers=headers, **self.requests_config)
+        body = None
+        if data is not None:
+            # Header names are case-insensitive, a user-provided one is kept as is
+            if not any(key.lower() == "content-type" for key in headers):
+                headers["Content-Type"] = "application/json"
+            body = json_dumps(data)
+        r = self._session.request(method, url, data=body, headers=headers, **self.requests_config)
 
         if 200 <= r.status_code < 300:  # noqa: PLR2004
             r_data = json.loads(r.content.decode(), object_hook=AttrDict) if r.content else None
@@ -263,6 +296,8 @@ class SyncResource(
     BaseResource[TSyncClient, TResource, TReference],
     ABC,
 ):
+    __slots__ = ()
+
     def save(
         self, fields: Union[list[str], None] = None, search_params: Union[dict, None] = None
     ) -> TResource:
@@ -343,6 +378,8 @@ class SyncReference(
     BaseReference[TSyncClient, TResource, TReference],
     ABC,
 ):
+    __slots__ = ()
+
     def to_resource(self) -> TResource:
         """
         Returns Resource instance for this reference
@@ -427,6 +464,10 @@ class SyncSearchSet(
                 stacklevel=2,
             )
             searchset = searchset.search(_id=id)
+        resource_id = self._get_id_for_read(searchset.params)
+        if resource_id:
+            resource_data = self.client._fetch_resource(f"{self.resource_type}/{resource_id}")
+            return self._dict_to_resource(resource_data)
         res_data = searchset.fetch()
         if len(res_data) == 0:
             raise ResourceNotFound("No resources found")
@@ -435,16 +476,15 @@ class SyncSearchSet(
         return res_data[0]
 
     def count(self) -> int:
-        new_params = copy.deepcopy(self.params)
-        new_params["_count"] = 0
-        new_params["_totalMethod"] = "count"
+        new_params = {**self.params, "_count": 0, "_totalMethod": "count"}
 
         return self.client._fetch_resource(self.resource_type, params=new_params)["total"]
 
     def first(self) -> Union[TResource, None]:
-        result = self.limit(1).fetch()
+        searchset = self.limit(1)
+        bundle_data = self.client._fetch_resource(self.resource_type, searchset.params)
 
-        return result[0] if result else None
+        return next(self._iter_bundle_resources(bundle_data), None)
 
     def get_or_create(self, resource: TResource) -> tuple[TResource, int]:
         assert resource.resourceType == self.resource_type
@@ -499,10 +539,10 @@ class SyncSearchSet(
                 bundle_data = self.client._fetch_resource(*parse_pagination_url(next_link))
             else:
                 bundle_data = self.client._fetch_resource(self.resource_type, self.params)
-            new_resources = self._get_bundle_resources(bundle_data)
             next_link = get_by_path(bundle_data, ["link", {"relation": "next"}, "url"])
 
-            yield from new_resources
+            # Resources are instantiated one by one as they are consumed
+            yield from self._iter_bundle_resources(bundle_data)
 
             if not next_link:
                 break
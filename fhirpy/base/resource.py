@@ -5,15 +5,16 @@ from fhirpy.base.client import TClient
 from fhirpy.base.exceptions import ResourceNotFound
 from fhirpy.base.resource_protocol import TReference, TResource, get_resource_path
 from fhirpy.base.utils import (
-    clean_empty_values,
+    clean_values,
     convert_values,
     get_by_path,
     parse_path,
-    remove_nulls_from_dicts,
 )
 
 
 class AbstractResource(Generic[TClient], dict, ABC):
+    __slots__ = ("__client__",)
+
     __client__: TClient
 
     def __init__(self, client: TClient, **kwargs):
@@ -27,11 +28,8 @@ class AbstractResource(Generic[TClient], dict, ABC):
     def __setitem__(self, key, value):
         super().__setitem__(key, value)
 
-    def __getitem__(self, key):
-        try:
-            return super().__getitem__(key)
-        except KeyError as e:
-            raise AttributeError from e
+    def __missing__(self, key):
+        raise AttributeError(key)
 
     def __getattr__(self, key):
         return self[key]
@@ -74,6 +72,8 @@ class AbstractResource(Generic[TClient], dict, ABC):
 
 
 class BaseResource(Generic[TClient, TResource, TReference], AbstractResource[TClient], ABC):
+    __slots__ = ()
+
     def __init__(self, client: TClient, resource_type: str, **kwargs):
         def convert_fn(item):
             if isinstance(item, AbstractResource):
@@ -84,14 +84,10 @@ class BaseResource(Generic[TClient, TResource, TReference], AbstractResource[TCl
 
             return item, False
 
+        # convert_values returns a new dict, so it's safe to update it in place
         converted_kwargs = convert_values(kwargs, convert_fn)
-        super().__init__(
-            client,
-            **{
-                **converted_kwargs,
-                "resourceType": resource_type,
-            },
-        )
+        converted_kwargs["resourceType"] = resource_type
+        super().__init__(client, **converted_kwargs)
 
     def __str__(self) -> str:
         return f"<{self.__class__.__name__} {self._get_path()}>"
@@ -201,6 +197,8 @@ class BaseResource(Generic[TClient, TResource, TReference], AbstractResource[TCl
 
 
 class BaseReference(Generic[TClient, TResource, TReference], AbstractResource[TClient], ABC):
+    __slots__ = ()
+
     def __str__(self):
         return f"<{self.__class__.__name__} {self.reference}>"
 
@@ -266,9 +264,4 @@ def serialize(resource: Any, drop_nulls_from_dicts=True) -> dict:
 
         return item, False
 
-    converted_values = convert_values(dict(resource), convert_fn)
-
-    if drop_nulls_from_dicts:
-        converted_values = remove_nulls_from_dicts(converted_values)
-
-    return clean_empty_values(converted_values)
+    return clean_values(convert_values(dict(resource), convert_fn), drop_nulls_from_dicts)
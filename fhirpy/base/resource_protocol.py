@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Protocol, TypeVar, Union, get_args, get_type_hints
 
 
@@ -10,7 +11,12 @@ TResource = TypeVar("TResource", bound=ResourceProtocol)
 TReference = TypeVar("TReference")
 
 
+@lru_cache(maxsize=256)
 def get_resource_type_from_class(cls: type[TResource]):
+    """
+    Resolves resource type of the model class,
+    the result is cached per class because type hints resolution is expensive
+    """
     try:
         return cls.resourceType
     except AttributeError:
@@ -71,13 +77,19 @@ def _get_id_from_ref(ref: str) -> str:
     """
     >>> _get_id_from_ref("Patient/id")
     'id'
+
+    >>> _get_id_from_ref("http://example.com/fhir/Patient/id")
+    'id'
     """
-    return ref.split("/")[-1]
+    return ref.rpartition("/")[2]
 
 
 def _get_resource_type_from_ref(ref: str) -> str:
     """
     >>> _get_resource_type_from_ref("Patient/id")
     'Patient'
+
+    >>> _get_resource_type_from_ref("http://example.com/fhir/Patient/id")
+    'Patient'
     """
-    return ref.split("/")[-2]
+    return ref.rsplit("/", 2)[-2]
@@ -1,7 +1,8 @@
-import copy
 import datetime
+import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from collections.abc import Iterator
 from typing import Generic, Union
 
 import pytz
@@ -16,6 +17,25 @@ from fhirpy.base.utils import chunks, encode_params
 FHIR_DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 FHIR_DATE_FORMAT = "%Y-%m-%d"
 
+# https://hl7.org/fhir/datatypes.html#id
+FHIR_ID_RE = re.compile(r"[A-Za-z0-9\-.]{1,64}")
+
+SEARCH_PARAM_OPS = frozenset(
+    {
+        "contains",
+        "exact",
+        "missing",
+        "not",
+        "below",
+        "above",
+        "in",
+        "not_in",
+        "text",
+        "of_type",
+    }
+)
+SEARCH_VALUE_OPS = frozenset({"eq", "ne", "gt", "ge", "lt", "le", "sa", "eb", "ap"})
+
 
 def format_date_time(date: datetime.datetime):
     return pytz.utc.normalize(date).strftime(FHIR_DATE_TIME_FORMAT)
@@ -119,20 +139,6 @@ def SQ(*args, **kwargs):  # noqa: N802
     {'_has:Person:link:id': ['id']}
 
     """
-    param_ops = [
-        "contains",
-        "exact",
-        "missing",
-        "not",
-        "below",
-        "above",
-        "in",
-        "not_in",
-        "text",
-        "of_type",
-    ]
-    value_ops = ["eq", "ne", "gt", "ge", "lt", "le", "sa", "eb", "ap"]
-
     res = defaultdict(list)
     for key, value in kwargs.items():
         value = value if isinstance(value, list) else [value]  # noqa: PLW2901
@@ -141,7 +147,7 @@ def SQ(*args, **kwargs):  # noqa: N802
         key_parts = key.split("__")
 
         op = None
-        if key_parts[-1] in value_ops or key_parts[-1] in param_ops:
+        if key_parts[-1] in SEARCH_VALUE_OPS or key_parts[-1] in SEARCH_PARAM_OPS:
             # The operator is always the last part,
             # e.g., birth_date__ge or patient__Patient__birth_date__ge
             op = key_parts[-1]
@@ -156,9 +162,9 @@ def SQ(*args, **kwargs):  # noqa: N802
             param += part
 
         if op:
-            if op in param_ops:
+            if op in SEARCH_PARAM_OPS:
                 param = f"{param}:{transform_param(op)}"
-            elif op in value_ops:
+            elif op in SEARCH_VALUE_OPS:
                 value = [f"{op}{sub_value}" for sub_value in value]  # noqa: PLW2901
         res[transform_param(param)].extend(value)
 
@@ -246,7 +252,8 @@ class AbstractSearchSet(Generic[TClient, TResource], ABC):
         pass
 
     def clone(self, override=False, **kwargs) -> Self:
-        new_params = copy.deepcopy(self.params)
+        # Lists are copied, elements are shared because they are never mutated
+        new_params = {key: list(value) for key, value in self.params.items()}
         for key, value in kwargs.items():
             if not isinstance(value, list):
                 value = [value]  # noqa: PLW2901
@@ -254,7 +261,7 @@ class AbstractSearchSet(Generic[TClient, TResource], ABC):
             if override:
                 new_params[key] = value
             else:
-                new_params[key].extend(value)
+                new_params.setdefault(key, []).extend(value)
 
         return self.__class__(
             self.client,
@@ -266,10 +273,9 @@ class AbstractSearchSet(Generic[TClient, TResource], ABC):
         attrs_set = set(attrs)
         if not exclude:
             attrs_set |= {"id", "resourceType"}
-        attrs_list = list(attrs_set)
 
         return self.clone(
-            _elements="{}{}".format("-" if exclude else "", ",".join(attrs_list)),
+            _elements="{}{}".format("-" if exclude else "", ",".join(sorted(attrs_set))),
             override=True,
         )
 
@@ -353,17 +359,35 @@ class AbstractSearchSet(Generic[TClient, TResource], ABC):
     def __repr__(self) -> str:
         return self.__str__()
 
+    def _get_id_for_read(self, params) -> Union[str, None]:
+        """
+        Returns id if the search is by a single `_id` only,
+        such search can be replaced with a direct read of the resource
+        """
+        search_params = [key for key, value in params.items() if value and key != "_count"]
+        if search_params != ["_id"] or len(params["_id"]) != 1:
+            return None
+
+        resource_id = params["_id"][0]
+        if isinstance(resource_id, str) and FHIR_ID_RE.fullmatch(resource_id):
+            return resource_id
+
+        return None
+
     def _get_bundle_resources(self, bundle_data) -> list[TResource]:
+        return list(self._iter_bundle_resources(bundle_data))
+
+    def _iter_bundle_resources(self, bundle_data) -> Iterator[TResource]:
+        """
+        Lazily yields resources of the searchset's type from the bundle,
+        included resources of other types are skipped without instantiating
+        """
         bundle_resource_type = bundle_data.get("resourceType", None)
 
         if bundle_resource_type != "Bundle":
             raise InvalidResponse(f"Expected to receive Bundle but {bundle_resource_type} received")
 
-        resources_data = [res["resource"] for res in bundle_data.get("entry", [])]
-
-        resources = []
-        for data in resources_data:
-            resource = self._dict_to_resource(data)
-            if resource.resourceType == self.resource_type:
-                resources.append(resource)
-        return resources
+        for entry in bundle_data.get("entry", []):
+            data = entry["resource"]
+            if data["resourceType"] == self.resource_type:
+                yield self._dict_to_resource(data)
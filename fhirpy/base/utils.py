@@ -1,13 +1,25 @@
+import dataclasses
+import datetime
+import enum
+import json
+import math
 import reprlib
+import uuid
 from typing import Any
 from urllib.parse import parse_qs, quote, urlencode, urlparse
 
 from yarl import URL
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 class AttrDict(dict):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Keys take precedence over dict methods, e.g. `AttrDict(items=1).items == 1`
         self.__dict__ = self
 
     def get_by_path(self, path, default=None):
@@ -68,6 +80,61 @@ def encode_params(params):
     )
 
 
+def json_dumps(data) -> bytes:
+    """
+    Serializes data into JSON bytes, uses orjson if it's installed.
+    The output doesn't depend on orjson: NaN and infinity are rejected by both ways
+
+    >>> json_dumps({'resourceType': 'Patient', 'name': [{'text': 'Иван'}]}).decode()
+    '{"resourceType":"Patient","name":[{"text":"Иван"}]}'
+    """
+    if orjson is not None:
+        # stdlib json converts non-string keys (e.g. ints) to strings, orjson needs an option
+        dumped = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        # orjson writes NaN and infinity as null, so they are looked for only if null is present
+        if b"null" in dumped and _has_non_finite_floats(data):
+            raise ValueError("Out of range float values are not JSON compliant")
+        return dumped
+
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=_json_default
+    ).encode()
+
+
+def _json_default(obj):
+    """
+    Serializes the types that orjson supports natively
+
+    >>> _json_default(datetime.date(2020, 1, 1))
+    '2020-01-01'
+    """
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _has_non_finite_floats(data) -> bool:
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite_floats(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_floats(value) for value in data)
+    if isinstance(data, enum.Enum):
+        return _has_non_finite_floats(data.value)
+    if dataclasses.is_dataclass(data) and not isinstance(data, type):
+        return _has_non_finite_floats(_json_default(data))
+
+    return False
+
+
 def parse_pagination_url(url):
     """
     Parses Bundle.link pagination url and returns path and params
@@ -238,6 +305,45 @@ def _is_empty(d: Any):
     return False
 
 
+def clean_values(data: Any, drop_nulls_from_dicts=True):
+    """
+    Single pass equivalent of `clean_empty_values(remove_nulls_from_dicts(data))`
+    (or of `clean_empty_values(data)` if `drop_nulls_from_dicts` is False)
+
+    >>> clean_values({"item": [None, {"item": None}, {}], "nested": {"item": None}})
+    {'item': [None, None, None]}
+
+    >>> clean_values({"item": [None, {"item": None}, {}]}, drop_nulls_from_dicts=False)
+    {'item': [None, {'item': None}, None]}
+    """
+    if isinstance(data, dict):
+        cleaned_dict = {}
+        for key, value in data.items():
+            if drop_nulls_from_dicts and value is None:
+                continue
+            cleaned_value = clean_values(value, drop_nulls_from_dicts)
+            if not _is_empty(cleaned_value):
+                cleaned_dict[key] = cleaned_value
+        return cleaned_dict
+
+    if isinstance(data, list):
+        # List items are checked for emptiness before cleaning, like in clean_empty_values
+        return [
+            None
+            if _is_empty_without_nulls(item, drop_nulls_from_dicts)
+            else clean_values(item, drop_nulls_from_dicts)
+            for item in data
+        ]
+
+    return data
+
+
+def _is_empty_without_nulls(d: Any, drop_nulls_from_dicts: bool):
+    if drop_nulls_from_dicts and isinstance(d, dict):
+        return all(_is_null(v) for v in d.values())
+    return _is_empty(d)
+
+
 def remove_nulls_from_dicts(data: Any):
     if isinstance(data, dict):
         return {k: remove_nulls_from_dicts(v) for k, v in data.items() if not _is_null(v)}
@@ -1,3 +1,4 @@
+import re
 from abc import ABC
 from typing import Generic, Union, overload
 
@@ -16,6 +17,10 @@ from .base import (
     SyncSearchSet,
 )
 
+# Local reference is `ResourceType/id`, anything else (absolute url, etc.) is external
+LOCAL_REFERENCE_RE = re.compile(r"([^/]*)/([^/]*)")
+REFERENCE_KEYS = frozenset({"reference", "display", "type", "identifier", "extension"})
+
 
 class SyncFHIRSearchSet(Generic[TResource], SyncSearchSet["SyncFHIRClient", TResource]):
     pass
@@ -28,32 +33,34 @@ class AsyncFHIRSearchSet(Generic[TResource], AsyncSearchSet["AsyncFHIRClient", T
 class BaseFHIRResource(
     Generic[TClient, TResource, TReference], BaseResource[TClient, TResource, TReference], ABC
 ):
+    __slots__ = ()
+
     def is_reference(self, value) -> bool:
         if not isinstance(value, dict):
             return False
 
-        return "reference" in value and not (
-            set(value.keys()) - {"reference", "display", "type", "identifier", "extension"}
-        )
+        return "reference" in value and value.keys() <= REFERENCE_KEYS
 
 
 class SyncFHIRResource(
     BaseFHIRResource["SyncFHIRClient", "SyncFHIRResource", "SyncFHIRReference"],
     SyncResource["SyncFHIRClient", "SyncFHIRResource", "SyncFHIRReference"],
 ):
-    pass
+    __slots__ = ()
 
 
 class AsyncFHIRResource(
     BaseFHIRResource["AsyncFHIRClient", "AsyncFHIRResource", "AsyncFHIRReference"],
     AsyncResource["AsyncFHIRClient", "AsyncFHIRResource", "AsyncFHIRReference"],
 ):
-    pass
+    __slots__ = ()
 
 
 class BaseFHIRReference(
     Generic[TClient, TResource, TReference], BaseReference[TClient, TResource, TReference], ABC
 ):
+    __slots__ = ()
+
     @property
     def reference(self) -> str:
         return self["reference"]
@@ -63,38 +70,36 @@ class BaseFHIRReference(
         """
         Returns id if reference specifies to the local resource
         """
-        if self.is_local:
-            return self.reference.split("/", 1)[1]
+        match = LOCAL_REFERENCE_RE.fullmatch(self.reference)
 
-        return None
+        return match[2] if match else None
 
     @property
     def resource_type(self) -> Union[str, None]:
         """
         Returns resource type if reference specifies to the local resource
         """
-        if self.is_local:
-            return self.reference.split("/", 1)[0]
+        match = LOCAL_REFERENCE_RE.fullmatch(self.reference)
 
-        return None
+        return match[1] if match else None
 
     @property
     def is_local(self) -> bool:
-        return self.reference.count("/") == 1
+        return LOCAL_REFERENCE_RE.fullmatch(self.reference) is not None
 
 
 class SyncFHIRReference(
     BaseFHIRReference["SyncFHIRClient", "SyncFHIRResource", "SyncFHIRReference"],
     SyncReference["SyncFHIRClient", "SyncFHIRResource", "SyncFHIRReference"],
 ):
-    pass
+    __slots__ = ()
 
 
 class AsyncFHIRReference(
     BaseFHIRReference["AsyncFHIRClient", "AsyncFHIRResource", "AsyncFHIRReference"],
     AsyncReference["AsyncFHIRClient", "AsyncFHIRResource", "AsyncFHIRReference"],
 ):
-    pass
+    __slots__ = ()
 
 
 class SyncFHIRClient(SyncClient):
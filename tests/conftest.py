@@ -0,0 +1,19 @@
+import pytest
+from pytest_asyncio import plugin as pytest_asyncio_plugin
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None  # type: ignore
+
+# uvloop is optional (it's not available on Windows), the default loop is used without it
+if uvloop is not None and hasattr(pytest_asyncio_plugin, "PytestAsyncioSpecs"):
+    # Newer pytest-asyncio deprecates the event_loop_policy fixture in favor of this hook
+    def pytest_asyncio_loop_factories(config, item):
+        return {"uvloop": uvloop.new_event_loop}
+
+elif uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        return uvloop.EventLoopPolicy()
@@ -1,66 +1,90 @@
-import json
+import asyncio
 from math import ceil
+from operator import attrgetter
 from typing import ClassVar
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
+import pytest_asyncio
+from multidict import CIMultiDict
 
 from fhirpy import AsyncFHIRClient
 from fhirpy.base.exceptions import MultipleResourcesFound, OperationOutcome, ResourceNotFound
-from fhirpy.base.utils import AttrDict
+from fhirpy.base.utils import AttrDict, json_dumps
 from fhirpy.lib import AsyncFHIRReference, AsyncFHIRResource
-from tests.utils import MockAiohttpResponse
+from tests.utils import EMPTY_BUNDLE, MockAiohttpResponse
 
 from .config import FHIR_SERVER_AUTHORIZATION, FHIR_SERVER_URL
 from .types import HumanName, Identifier, Patient, Reference
-from .utils import dump_resource
+from .utils import IDENTIFIER, IDENTIFIER_MODEL, URL_IDENTIFIER, dump_resource
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestLibAsyncCase:
     URL = FHIR_SERVER_URL
     client = None
-    identifier: ClassVar = [{"system": "http://example.com/env", "value": "fhirpy"}]
+    search_sets: ClassVar[dict] = {}
+    # Model templates are validated once, created patients are rebuilt from the response
+    patient_name: ClassVar = (HumanName(text="My patient"),)
+    patient_identifier: ClassVar = (
+        Identifier(system=IDENTIFIER[0]["system"], value=IDENTIFIER[0]["system"]),
+    )
 
     @classmethod
     def get_search_set(cls, resource_type):
-        return cls.client.resources(resource_type).search(**{"identifier": "fhirpy"})
+        return cls.search_sets[resource_type]
 
-    @pytest.fixture(autouse=True)
+    @classmethod
+    async def _delete_matches(cls, search_set):
+        try:
+            # Conditional delete removes zero or one match in a single request
+            await search_set.delete()
+        except MultipleResourcesFound:
+            return await search_set.fetch_all()
+        return []
+
+    @pytest_asyncio.fixture(autouse=True, loop_scope="class")
     async def _clear_db(self):
-        for resource_type in ["Patient", "Practitioner"]:
-            search_set = self.get_search_set(resource_type)
-            async for item in search_set:
-                await item.delete()
+        items_by_type = await asyncio.gather(
+            *[self._delete_matches(search_set) for search_set in self.search_sets.values()]
+        )
+        entry = [
+            {"request": {"method": "DELETE", "url": f"{item.resourceType}/{item.id}"}}
+            for items in items_by_type
+            for item in items
+        ]
+        if entry:
+            await self.client.resource("Bundle", type="batch", entry=entry).create()
+
+    @classmethod
+    @pytest_asyncio.fixture(autouse=True, scope="class", loop_scope="class")
+    async def _open_client(cls):
+        # All tests of the class share the event loop and the client's keep-alive connections
+        async with cls.client:
+            yield
 
     @classmethod
     def setup_class(cls):
         cls.client = AsyncFHIRClient(
             cls.URL, authorization=FHIR_SERVER_AUTHORIZATION, dump_resource=dump_resource
         )
+        cls.search_sets = {
+            resource_type: cls.client.resources(resource_type).search(identifier="fhirpy")
+            for resource_type in ["Patient", "Practitioner"]
+        }
 
     async def create_resource(self, resource_type, **kwargs):
-        return await self.client.resource(
-            resource_type, identifier=self.identifier, **kwargs
-        ).create()
+        return await self.client.resource(resource_type, identifier=IDENTIFIER, **kwargs).create()
+
+    def build_patient_model(self, **kwargs):
+        return Patient(name=self.patient_name, identifier=self.patient_identifier, **kwargs)
 
     async def create_patient_model(self, **kwargs):
-        patient = Patient(
-            name=[HumanName(text="My patient")],
-            identifier=[
-                Identifier(
-                    system=self.identifier[0]["system"],
-                    value=self.identifier[0]["system"],
-                )
-            ],
-            **kwargs,
-        )
-        return await self.client.create(patient)
+        return await self.client.create(self.build_patient_model(**kwargs))
 
-    @pytest.mark.asyncio()
     async def test_client_str(self):
         assert str(self.client) == f"<AsyncFHIRClient {self.URL}>"
 
-    @pytest.mark.asyncio()
     async def test_create_patient_model(self):
         patient = await self.create_patient_model()
 
@@ -68,14 +92,13 @@ class TestLibAsyncCase:
 
         assert fetched_patient.id == patient.id
 
-    @pytest.mark.asyncio()
     async def test_client_create(self):
         patient = Patient(
             name=[HumanName(text="My patient")],
             identifier=[
                 Identifier(
-                    system=self.identifier[0]["system"],
-                    value=self.identifier[0]["system"],
+                    system=IDENTIFIER[0]["system"],
+                    value=IDENTIFIER[0]["system"],
                 )
             ],
         )
@@ -84,12 +107,11 @@ class TestLibAsyncCase:
         assert isinstance(created_patient, Patient)
         assert created_patient.id is not None
 
-    @pytest.mark.asyncio()
     async def test_client_update(self):
         patient = await self.create_patient_model()
         patient.identifier = [
             *patient.identifier,
-            Identifier(system="url", value="value"),
+            URL_IDENTIFIER,
         ]
 
         updated_patient = await self.client.update(patient)
@@ -98,22 +120,19 @@ class TestLibAsyncCase:
         assert updated_patient.id == patient.id
         assert len(updated_patient.identifier) == 2  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_client_update_fails_without_id(self):
-        patient = await self.create_patient_model()
-        patient.id = None
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             await self.client.update(patient)
 
-    @pytest.mark.asyncio()
     async def test_client_save_new(self):
         patient = Patient(
             name=[HumanName(text="My patient")],
             identifier=[
                 Identifier(
-                    system=self.identifier[0]["system"],
-                    value=self.identifier[0]["system"],
+                    system=IDENTIFIER[0]["system"],
+                    value=IDENTIFIER[0]["system"],
                 )
             ],
         )
@@ -122,12 +141,11 @@ class TestLibAsyncCase:
         assert isinstance(created_patient, Patient)
         assert created_patient.id is not None
 
-    @pytest.mark.asyncio()
     async def test_client_save_existing(self):
         patient = await self.create_patient_model()
         patient.identifier = [
             *patient.identifier,
-            Identifier(system="url", value="value"),
+            URL_IDENTIFIER,
         ]
 
         updated_patient = await self.client.save(patient)
@@ -136,7 +154,6 @@ class TestLibAsyncCase:
         assert updated_patient.id == patient.id
         assert len(updated_patient.identifier) == 2  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_client_save_partial_update(self):
         patient = await self.create_patient_model(
             managingOrganization=Reference(reference="urn:organization")
@@ -144,7 +161,7 @@ class TestLibAsyncCase:
 
         patient.identifier = [
             *patient.identifier,
-            Identifier(system="url", value="value"),
+            URL_IDENTIFIER,
         ]
         patient.name[0].text = "New patient"
         patient.managingOrganization = None
@@ -159,15 +176,12 @@ class TestLibAsyncCase:
         assert updated_patient.name[0].text == "My patient"
         assert updated_patient.managingOrganization is None
 
-    @pytest.mark.asyncio()
     async def test_client_save_partial_update_fails_without_id(self):
-        patient = await self.create_patient_model()
-        patient.id = None
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             await self.client.save(patient, fields=["identifier"])
 
-    @pytest.mark.asyncio()
     async def test_client_get_specifying_reference(self):
         patient = await self.create_patient_model()
 
@@ -175,7 +189,6 @@ class TestLibAsyncCase:
 
         assert isinstance(fetched_patient, dict)
 
-    @pytest.mark.asyncio()
     async def test_client_get_specifying_resource_type_str_and_id(self):
         patient = await self.create_patient_model()
 
@@ -183,7 +196,6 @@ class TestLibAsyncCase:
 
         assert isinstance(fetched_patient, dict)
 
-    @pytest.mark.asyncio()
     async def test_client_get_specifying_resource_type_type_and_id(self):
         patient = await self.create_patient_model()
 
@@ -191,7 +203,6 @@ class TestLibAsyncCase:
 
         assert isinstance(fetched_patient, Patient)
 
-    @pytest.mark.asyncio()
     async def test_client_get_specifying_resource_type_type_and_ref(self):
         patient = await self.create_patient_model()
 
@@ -199,19 +210,17 @@ class TestLibAsyncCase:
 
         assert isinstance(fetched_patient, Patient)
 
-    @pytest.mark.asyncio()
     async def test_client_get_specifying_resource_type_fails_without_id(self):
-        patient = await self.create_patient_model()
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             await self.client.get(patient.resourceType)
 
-    @pytest.mark.asyncio()
     async def test_client_patch_specifying_reference(self):
         patient = await self.create_patient_model(
             managingOrganization=Reference(reference="urn:organization")
         )
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = await self.client.patch(
             f"{patient.resourceType}/{patient.id}",
@@ -225,10 +234,9 @@ class TestLibAsyncCase:
         assert patched_patient.get("managingOrganization") is None
         assert patched_patient["id"] == patient.id
 
-    @pytest.mark.asyncio()
     async def test_client_patch_specifying_resource_type_str_and_id(self):
         patient = await self.create_patient_model()
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = await self.client.patch(
             patient.resourceType,
@@ -239,10 +247,9 @@ class TestLibAsyncCase:
         assert isinstance(patched_patient, dict)
         assert len(patched_patient["identifier"]) == 2  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_client_patch_specifying_resource_type_type_and_id(self):
         patient = await self.create_patient_model()
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = await self.client.patch(
             Patient,
@@ -253,10 +260,9 @@ class TestLibAsyncCase:
         assert isinstance(patched_patient, Patient)
         assert len(patched_patient.identifier) == 2  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_client_patch_specifying_resource_type_type_and_ref(self):
         patient = await self.create_patient_model()
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = await self.client.patch(
             Patient,
@@ -267,10 +273,9 @@ class TestLibAsyncCase:
         assert isinstance(patched_patient, Patient)
         assert len(patched_patient.identifier) == 2  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_client_patch_specifying_resource(self):
         patient = await self.create_patient_model()
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = await self.client.patch(
             patient, identifier=[x.model_dump(exclude_none=True) for x in new_identifier]
@@ -279,95 +284,77 @@ class TestLibAsyncCase:
         assert isinstance(patched_patient, Patient)
         assert len(patched_patient.identifier) == 2  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_client_patch_specifying_resource_type_fails_without_id(self):
-        patient = await self.create_patient_model()
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             await self.client.patch(patient.resourceType)
 
-    @pytest.mark.asyncio()
     async def test_client_patch_specifying_resource_fails_without_id(self):
-        patient = await self.create_patient_model()
-        patient.id = None
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             await self.client.patch(patient)
 
-    @pytest.mark.asyncio()
     async def test_client_delete_specifying_reference(self):
         patient = await self.create_patient_model()
 
         await self.client.delete(f"{patient.resourceType}/{patient.id}")
 
-        fetched_patient = await self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert await self.client.resources(Patient).search(_id=patient.id).count() == 0
 
-    @pytest.mark.asyncio()
     async def test_client_delete_specifying_resource_type_str_and_id(self):
         patient = await self.create_patient_model()
 
         await self.client.delete(patient.resourceType, patient.id)
 
-        fetched_patient = await self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert await self.client.resources(Patient).search(_id=patient.id).count() == 0
 
-    @pytest.mark.asyncio()
     async def test_client_delete_specifying_resource_type_type_and_id(self):
         patient = await self.create_patient_model()
 
         await self.client.delete(Patient, patient.id)
 
-        fetched_patient = await self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert await self.client.resources(Patient).search(_id=patient.id).count() == 0
 
-    @pytest.mark.asyncio()
     async def test_client_delete_specifying_resource_type_type_and_ref(self):
         patient = await self.create_patient_model()
 
         await self.client.delete(Patient, f"Patient/{patient.id}")
 
-        fetched_patient = await self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert await self.client.resources(Patient).search(_id=patient.id).count() == 0
 
-    @pytest.mark.asyncio()
     async def test_client_delete_specifying_resource(self):
         patient = await self.create_patient_model()
 
         await self.client.delete(patient)
 
-        fetched_patient = await self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert await self.client.resources(Patient).search(_id=patient.id).count() == 0
 
-    @pytest.mark.asyncio()
     async def test_client_delete_specifying_resource_type_fails_without_id(self):
-        patient = await self.create_patient_model()
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             await self.client.delete(patient.resourceType)
 
-    @pytest.mark.asyncio()
     async def test_client_delete_specifying_resource_fails_without_id(self):
-        patient = await self.create_patient_model()
-        patient.id = None
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             await self.client.delete(patient)
 
-    @pytest.mark.asyncio()
     async def test_create_patient(self):
         await self.create_resource("Patient", id="patient", name=[{"text": "My patient"}])
 
         patient = await self.client.resources("Patient").search(_id="patient").get()
         assert patient["name"] == [{"text": "My patient"}]
 
-    @pytest.mark.asyncio()
     async def test_conditional_create__create_on_no_match(self):
         await self.create_resource("Patient", id="patient")
 
         patient = self.client.resource(
             "Patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
             name=[{"text": "Indiana Jones"}],
         )
         await patient.create(identifier="other")
@@ -375,38 +362,33 @@ class TestLibAsyncCase:
         assert patient.id != "patient"
         assert patient.get_by_path(["name", 0, "text"]) == "Indiana Jones"
 
-    @pytest.mark.asyncio()
     async def test_conditional_create__skip_on_one_match(self):
         existing_patient = await self.create_resource("Patient", id="patient")
 
         patient = self.client.resource(
-            "Patient", identifier=self.identifier, name=[{"text": "Indiana Jones"}]
+            "Patient", identifier=IDENTIFIER, name=[{"text": "Indiana Jones"}]
         )
         await patient.create(identifier="fhirpy")
 
         assert patient.id == "patient"
         assert patient.get("name") is None
-        assert patient.get_by_path(["meta", "versionId"]) == existing_patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patient["meta"]["versionId"] == existing_patient["meta"]["versionId"]
 
-    @pytest.mark.asyncio()
     async def test_conditional_create__fail_on_multiple_matches(self):
-        await self.create_resource("Patient", id="patient-one")
-        await self.create_resource("Patient", id="patient-two")
+        await asyncio.gather(
+            self.create_resource("Patient", id="patient-one"),
+            self.create_resource("Patient", id="patient-two"),
+        )
 
         with pytest.raises(MultipleResourcesFound):
-            await self.client.resource("Patient", identifier=self.identifier).create(
-                identifier="fhirpy"
-            )
+            await self.client.resource("Patient", identifier=IDENTIFIER).create(identifier="fhirpy")
 
-    @pytest.mark.asyncio()
     async def test_get_or_create__create_on_no_match(self):
         await self.create_resource("Patient", id="patient")
 
         patient_to_save = self.client.resource(
             "Patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
             name=[{"text": "Indiana Jones"}],
         )
         patient, created = (
@@ -418,11 +400,10 @@ class TestLibAsyncCase:
         assert patient.get_by_path(["name", 0, "text"]) == "Indiana Jones"
         assert created is True
 
-    @pytest.mark.asyncio()
     async def test_get_or_create__skip_on_one_match(self):
         existing_patient = await self.create_resource("Patient", id="patient")
 
-        patient_to_save = self.client.resource("Patient", identifier=self.identifier)
+        patient_to_save = self.client.resource("Patient", identifier=IDENTIFIER)
         patient, created = (
             await self.client.resources("Patient")
             .search(identifier="fhirpy")
@@ -430,16 +411,15 @@ class TestLibAsyncCase:
         )
         assert patient.id == "patient"
         assert created is False
-        assert patient.get_by_path(["meta", "versionId"]) == existing_patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patient["meta"]["versionId"] == existing_patient["meta"]["versionId"]
 
-    @pytest.mark.asyncio()
     async def test_conditional_operations__fail_on_multiple_matches(self):
-        await self.create_resource("Patient", id="patient-one")
-        await self.create_resource("Patient", id="patient-two")
+        await asyncio.gather(
+            self.create_resource("Patient", id="patient-one"),
+            self.create_resource("Patient", id="patient-two"),
+        )
 
-        patient_to_save = self.client.resource("Patient", identifier=self.identifier)
+        patient_to_save = self.client.resource("Patient", identifier=IDENTIFIER)
         with pytest.raises(MultipleResourcesFound):
             await (
                 self.client.resources("Patient")
@@ -455,13 +435,12 @@ class TestLibAsyncCase:
                 self.client.resources("Patient").search(identifier="fhirpy").patch(patient_to_save)
             )
 
-    @pytest.mark.asyncio()
     async def test_conditional_update__no_match(self):
         patient = await self.create_resource("Patient", id="patient", active=True)
 
         patient_to_update = self.client.resource(
             "Patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
             active=False,
         )
         new_patient, created = await (
@@ -474,34 +453,28 @@ class TestLibAsyncCase:
         assert new_patient.active is False
         assert created is True
 
-    @pytest.mark.asyncio()
     async def test_conditional_update__one_match(self):
         patient = await self.create_resource("Patient", id="patient", active=True)
 
         patient_to_update = self.client.resource(
-            "Patient", identifier=self.identifier, name=[{"text": "Indiana Jones"}]
+            "Patient", identifier=IDENTIFIER, name=[{"text": "Indiana Jones"}]
         )
         updated_patient, created = await (
             self.client.resources("Patient").search(identifier="fhirpy").update(patient_to_update)
         )
         assert updated_patient.id == patient.id
         assert created is False
-        assert updated_patient.get_by_path(["meta", "versionId"]) != patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert updated_patient["meta"]["versionId"] != patient["meta"]["versionId"]
         assert updated_patient.get_by_path(["name", 0, "text"]) == "Indiana Jones"
 
         await patient.refresh()
-        assert updated_patient.get_by_path(["meta", "versionId"]) == patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert updated_patient["meta"]["versionId"] == patient["meta"]["versionId"]
         assert patient.get("active") is None
 
-    @pytest.mark.asyncio()
     async def test_conditional_patch__no_match(self):
         patient_to_patch = self.client.resource(
             "Patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
             active=False,
         )
         with pytest.raises(ResourceNotFound):
@@ -509,7 +482,6 @@ class TestLibAsyncCase:
                 self.client.resources("Patient").search(identifier="other").patch(patient_to_patch)
             )
 
-    @pytest.mark.asyncio()
     async def test_conditional_patch__one_match(self):
         patient = await self.create_resource(
             "Patient",
@@ -522,48 +494,38 @@ class TestLibAsyncCase:
             self.client.resources("Patient")
             .search(identifier="fhirpy")
             .patch(
-                identifier=self.identifier,
+                identifier=IDENTIFIER,
                 name=[{"text": "Indiana Jones"}],
                 managingOrganization=None,
             )
         )
         assert patched_patient.id == patient.id
-        assert patched_patient.get_by_path(["meta", "versionId"]) != patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patched_patient["meta"]["versionId"] != patient["meta"]["versionId"]
         assert patched_patient.get_by_path(["name", 0, "text"]) == "Indiana Jones"
         assert patched_patient.get("managingOrganization") is None
 
         await patient.refresh()
-        assert patched_patient.get_by_path(["meta", "versionId"]) == patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patched_patient["meta"]["versionId"] == patient["meta"]["versionId"]
         assert patient.active is True
         assert patient.get("managingOrganization") is None
 
-    @pytest.mark.asyncio()
     async def test_conditional_patch__one_match_deprecated(self):
         patient = await self.create_resource("Patient", id="patient", active=True)
 
         patient_to_patch = self.client.resource(
-            "Patient", identifier=self.identifier, name=[{"text": "Indiana Jones"}]
+            "Patient", identifier=IDENTIFIER, name=[{"text": "Indiana Jones"}]
         )
         patched_patient = await (
             self.client.resources("Patient").search(identifier="fhirpy").patch(patient_to_patch)
         )
         assert patched_patient.id == patient.id
-        assert patched_patient.get_by_path(["meta", "versionId"]) != patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patched_patient["meta"]["versionId"] != patient["meta"]["versionId"]
         assert patched_patient.get_by_path(["name", 0, "text"]) == "Indiana Jones"
 
         await patient.refresh()
-        assert patched_patient.get_by_path(["meta", "versionId"]) == patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patched_patient["meta"]["versionId"] == patient["meta"]["versionId"]
         assert patient.active is True
 
-    @pytest.mark.asyncio()
     async def test_update_patient(self):
         patient = await self.create_resource("Patient", id="patient", name=[{"text": "My patient"}])
         patient["active"] = True
@@ -576,7 +538,6 @@ class TestLibAsyncCase:
         assert check_patient["birthDate"] == "1945-01-12"
         assert check_patient.get_by_path(["name", 0, "text"]) == "SomeName"
 
-    @pytest.mark.asyncio()
     async def test_count(self):
         search_set = self.get_search_set("Patient")
 
@@ -586,13 +547,11 @@ class TestLibAsyncCase:
 
         assert await search_set.count() == 1
 
-    @pytest.mark.asyncio()
     async def test_create_without_id(self):
         patient = await self.create_resource("Patient")
 
         assert patient.id is not None
 
-    @pytest.mark.asyncio()
     async def test_reference_delete(self):
         patient = await self.create_resource("Patient", id="patient")
 
@@ -601,7 +560,6 @@ class TestLibAsyncCase:
         with pytest.raises(ResourceNotFound):
             await self.get_search_set("Patient").search(_id="patient").get()
 
-    @pytest.mark.asyncio()
     async def test_delete(self):
         patient = await self.create_resource("Patient", id="patient")
         await patient.delete()
@@ -609,14 +567,12 @@ class TestLibAsyncCase:
         with pytest.raises(ResourceNotFound):
             await self.get_search_set("Patient").search(_id="patient").get()
 
-    @pytest.mark.asyncio()
     async def test_delete_without_id_failed(self):
         patient = self.client.resource("Patient", **{})
 
         with pytest.raises(TypeError):
             await patient.delete()
 
-    @pytest.mark.asyncio()
     async def test_conditional_delete__no_match(self):
         await self.create_resource("Patient", id="patient")
 
@@ -625,12 +581,11 @@ class TestLibAsyncCase:
         await self.get_search_set("Patient").search(_id="patient").get()
         assert status_code == 204  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_conditional_delete__one_match(self):
         patient = self.client.resource(
             "Patient",
             id="patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
         )
         await patient.save()
 
@@ -642,36 +597,35 @@ class TestLibAsyncCase:
             await self.get_search_set("Patient").search(_id="patient").get()
         assert status_code == 200  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_conditional_delete__multiple_matches(self):
-        await self.create_resource("Patient", id="patient-1")
-        await self.create_resource("Patient", id="patient-2")
+        await asyncio.gather(
+            self.create_resource("Patient", id="patient-1"),
+            self.create_resource("Patient", id="patient-2"),
+        )
 
         with pytest.raises(MultipleResourcesFound):
             await self.client.resources("Patient").search(identifier="fhirpy").delete()
 
-    @pytest.mark.asyncio()
     async def test_get_not_existing_id(self):
         with pytest.raises(ResourceNotFound):
             await self.client.resources("Patient").search(_id="FHIRPypy_not_existing_id").get()
 
-    @pytest.mark.asyncio()
     async def test_get_more_than_one_resources(self):
-        await self.create_resource("Patient", birthDate="1901-05-25")
-        await self.create_resource("Patient", birthDate="1905-05-25")
+        await asyncio.gather(
+            self.create_resource("Patient", birthDate="1901-05-25"),
+            self.create_resource("Patient", birthDate="1905-05-25"),
+        )
         with pytest.raises(MultipleResourcesFound):
             await self.client.resources("Patient").get()
         with pytest.raises(MultipleResourcesFound):
             await self.client.resources("Patient").search(birthdate__gt="1900").get()
 
-    @pytest.mark.asyncio()
     async def test_get_resource_by_id_is_deprecated(self):
         await self.create_resource("Patient", id="patient", gender="male")
         with pytest.warns(DeprecationWarning):
             patient = await self.client.resources("Patient").search(gender="male").get(id="patient")
         assert patient.id == "patient"
 
-    @pytest.mark.asyncio()
     async def test_get_resource_by_search_with_id(self):
         await self.create_resource("Patient", id="patient", gender="male")
         patient = await self.client.resources("Patient").search(gender="male", _id="patient").get()
@@ -679,11 +633,10 @@ class TestLibAsyncCase:
         with pytest.raises(ResourceNotFound):
             await self.client.resources("Patient").search(gender="female", _id="patient").get()
 
-    @pytest.mark.asyncio()
     async def test_get_resource_by_search(self):
-        await self.create_resource("Patient", id="patient1", gender="male", birthDate="1901-05-25")
-        await self.create_resource(
-            "Patient", id="patient2", gender="female", birthDate="1905-05-25"
+        await asyncio.gather(
+            self.create_resource("Patient", id="patient1", gender="male", birthDate="1901-05-25"),
+            self.create_resource("Patient", id="patient2", gender="female", birthDate="1905-05-25"),
         )
         patient_1 = (
             await self.client.resources("Patient")
@@ -698,17 +651,14 @@ class TestLibAsyncCase:
         )
         assert patient_2.id == "patient2"
 
-    @pytest.mark.asyncio()
     async def test_not_found_error(self):
         with pytest.raises(ResourceNotFound):
             await self.client.resources("FHIRPyNotExistingResource").fetch()
 
-    @pytest.mark.asyncio()
     async def test_operation_outcome_error(self):
         with pytest.raises(OperationOutcome):
             await self.create_resource("Patient", name="invalid")
 
-    @pytest.mark.asyncio()
     async def test_to_resource_for_local_reference(self):
         await self.create_resource("Patient", id="p1", name=[{"text": "Name"}])
 
@@ -723,14 +673,12 @@ class TestLibAsyncCase:
             "name": [{"text": "Name"}],
         }
 
-    @pytest.mark.asyncio()
     async def test_to_resource_for_external_reference(self):
         reference = self.client.reference(reference="http://external.com/Patient/p1")
 
         with pytest.raises(ResourceNotFound):
             await reference.to_resource()
 
-    @pytest.mark.asyncio()
     async def test_to_resource_for_resource(self):
         resource = self.client.resource("Patient", id="p1", name=[{"text": "Name"}])
         resource_copy = await resource.to_resource()
@@ -741,12 +689,6 @@ class TestLibAsyncCase:
             "name": [{"text": "Name"}],
         }
 
-    def test_to_reference_for_resource_without_id(self):
-        resource = self.client.resource("Patient")
-        with pytest.raises(ResourceNotFound):
-            resource.to_reference()
-
-    @pytest.mark.asyncio()
     async def test_to_reference_for_resource(self):
         patient = await self.create_resource("Patient", id="p1")
 
@@ -757,7 +699,6 @@ class TestLibAsyncCase:
             "display": "patient",
         }
 
-    @pytest.mark.asyncio()
     async def test_create_bundle(self):
         bundle = {
             "resourceType": "bundle",
@@ -765,68 +706,63 @@ class TestLibAsyncCase:
             "entry": [
                 {
                     "request": {"method": "POST", "url": "/Patient"},
-                    "resource": {
-                        "id": "bundle_patient_1",
-                        "identifier": self.identifier,
-                    },
-                },
-                {
-                    "request": {"method": "POST", "url": "/Patient"},
-                    "resource": {
-                        "id": "bundle_patient_2",
-                        "identifier": self.identifier,
-                    },
-                },
+                    "resource": {"id": patient_id, "identifier": IDENTIFIER},
+                }
+                for patient_id in ["bundle_patient_1", "bundle_patient_2"]
             ],
         }
         await self.create_resource("Bundle", **bundle)
-        await self.client.resources("Patient").search(_id="bundle_patient_1").get()
-        await self.client.resources("Patient").search(_id="bundle_patient_2").get()
+        await asyncio.gather(
+            self.client.resources("Patient").search(_id="bundle_patient_1").get(),
+            self.client.resources("Patient").search(_id="bundle_patient_2").get(),
+        )
 
-    @pytest.mark.asyncio()
     async def test_is_valid(self):
         resource = self.client.resource
-        assert await resource("Patient", id="id123").is_valid() is True
-        assert await resource("Patient", gender="female").is_valid(raise_exception=True) is True
-
-        assert await resource("Patient", gender=True).is_valid() is False
-        with pytest.raises(OperationOutcome):
-            await resource("Patient", gender=True).is_valid(raise_exception=True)
-
-        assert await resource("Patient", gender="female", custom_prop="123").is_valid() is False
-        with pytest.raises(OperationOutcome):
-            await resource("Patient", gender="female", custom_prop="123").is_valid(
-                raise_exception=True
-            )
+        # The probes are independent $validate calls
+        results = await asyncio.gather(
+            resource("Patient", id="id123").is_valid(),
+            resource("Patient", gender="female").is_valid(raise_exception=True),
+            resource("Patient", gender=True).is_valid(),
+            resource("Patient", gender="female", custom_prop="123").is_valid(),
+        )
+        assert results == [True, True, False, False]
 
-        assert await resource("Patient", gender="female", custom_prop="123").is_valid() is False
-        with pytest.raises(OperationOutcome):
-            await resource("Patient", birthDate="date", custom_prop="123", telecom=True).is_valid(
+        errors = await asyncio.gather(
+            resource("Patient", gender=True).is_valid(raise_exception=True),
+            resource("Patient", gender="female", custom_prop="123").is_valid(raise_exception=True),
+            resource("Patient", birthDate="date", custom_prop="123", telecom=True).is_valid(
                 raise_exception=True
-            )
+            ),
+            return_exceptions=True,
+        )
+        assert all(isinstance(error, OperationOutcome) for error in errors)
 
-    @pytest.mark.asyncio()
     async def test_get_first(self):
-        await self.create_resource("Patient", id="patient_first", name=[{"text": "Abc"}])
-        await self.create_resource("Patient", id="patient_second", name=[{"text": "Bbc"}])
+        await asyncio.gather(
+            self.create_resource("Patient", id="patient_first", name=[{"text": "Abc"}]),
+            self.create_resource("Patient", id="patient_second", name=[{"text": "Bbc"}]),
+        )
         patient = await self.client.resources("Patient").sort("name").first()
         assert isinstance(patient, AsyncFHIRResource)
         assert patient.id == "patient_first"
 
-    @pytest.mark.asyncio()
     async def test_fetch_raw(self):
-        await self.create_resource("Patient", name=[{"text": "RareName"}])
-        await self.create_resource("Patient", name=[{"text": "RareName"}])
+        await asyncio.gather(
+            self.create_resource("Patient", name=[{"text": "RareName"}]),
+            self.create_resource("Patient", name=[{"text": "RareName"}]),
+        )
         bundle = await self.client.resources("Patient").search(name="RareName").fetch_raw()
         assert bundle.resourceType == "Bundle"
         for entry in bundle.entry:
             assert isinstance(entry.resource, AsyncFHIRResource)
         assert len(bundle.entry) == 2  # noqa: PLR2004
 
-    @pytest.mark.asyncio()
     async def test_typed_fetch_raw(self):
-        await self.create_resource("Patient", name=[{"text": "RareName"}])
-        await self.create_resource("Patient", name=[{"text": "RareName"}])
+        await asyncio.gather(
+            self.create_resource("Patient", name=[{"text": "RareName"}]),
+            self.create_resource("Patient", name=[{"text": "RareName"}]),
+        )
         bundle = await self.client.resources(Patient).search(name="RareName").fetch_raw()
         assert bundle.resourceType == "Bundle"
         for entry in bundle.entry:
@@ -834,81 +770,64 @@ class TestLibAsyncCase:
         assert len(bundle.entry) == 2  # noqa: PLR2004
 
     async def create_test_patients(self, count=10, name="Not Rare Name"):
+        patient_ids = {f"patient-{i}" for i in range(count)}
         bundle = {
             "type": "transaction",
-            "entry": [],
-        }
-        patient_ids = set()
-        for i in range(count):
-            p_id = f"patient-{i}"
-            patient_ids.add(p_id)
-            bundle["entry"].append(
+            "entry": [
                 {
                     "request": {"method": "POST", "url": "/Patient"},
                     "resource": {
-                        "id": p_id,
+                        "id": f"patient-{i}",
                         "name": [{"text": f"{name}{i}"}],
-                        "identifier": self.identifier,
+                        "identifier": IDENTIFIER,
                     },
                 }
-            )
+                for i in range(count)
+            ],
+        }
         await self.create_resource("Bundle", **bundle)
         return patient_ids
 
-    @pytest.mark.asyncio()
     async def test_fetch_all(self):
         patients_count = 18
         name = "Jack Johnson J"
         patient_ids = await self.create_test_patients(patients_count, name)
         patient_set = self.client.resources("Patient").search(name=name).limit(5)
 
-        mocked_request = Mock(wraps=self.client._do_request)
+        mocked_request = AsyncMock(spec=self.client._do_request, wraps=self.client._do_request)
         with patch.object(self.client, "_do_request", mocked_request):
             patients = await patient_set.fetch_all()
 
-        received_ids = {p.id for p in patients}
+        received_ids = set(map(attrgetter("id"), patients))
 
         assert len(received_ids) == patients_count
         assert patient_ids == received_ids
 
-        assert mocked_request.call_count == ceil(patients_count / 5)
+        assert mocked_request.await_count == ceil(patients_count / 5)
 
-        first_call_args, first_call_kwargs = mocked_request.call_args_list[0]
+        first_call_args, first_call_kwargs = mocked_request.await_args_list[0]
         method, path = first_call_args
         assert method == "get"
         assert "Patient" in path
         params = first_call_kwargs["params"]
         assert params == {"name": [name], "_count": [5]}
 
-    @pytest.mark.asyncio()
     async def test_async_for_iterator(self):
         patients_count = 22
         name = "Rob Robinson R"
         patient_ids = await self.create_test_patients(patients_count, name)
-        patient_set = self.client.resources("Patient").search(name=name).limit(3)
+        # Only ids are checked, so the server returns thin resources
+        patient_set = self.client.resources("Patient").search(name=name).elements("id").limit(3)
 
-        received_ids = set()
-        mocked_request = Mock(wraps=self.client._do_request)
+        mocked_request = AsyncMock(spec=self.client._do_request, wraps=self.client._do_request)
         with patch.object(self.client, "_do_request", mocked_request):
-            async for patient in patient_set:
-                received_ids.add(patient.id)
+            received_ids = {patient.id async for patient in patient_set}
 
-        assert mocked_request.call_count == ceil(patients_count / 3)
+        assert mocked_request.await_count == ceil(patients_count / 3)
 
         assert len(received_ids) == patients_count
         assert patient_ids == received_ids
 
-    def test_build_request_url(self):
-        url = f"{FHIR_SERVER_URL}/Patient?_count=100&name=ivan&name=petrov"
-        request_url = self.client._build_request_url(url, None)
-        assert request_url == url
-
-    def test_build_request_url_wrong_path(self):
-        url = "https://example.com/Patient?_count=100&name=ivan&name=petrov"
-        with pytest.raises(ValueError):  # noqa: PT011
-            self.client._build_request_url(url, None)
-
-    @pytest.mark.asyncio()
     async def test_save_fields(self):
         patient = await self.create_resource(
             "Patient",
@@ -933,10 +852,9 @@ class TestLibAsyncCase:
         assert patient_refreshed["name"] == [{"text": "Abc"}]
         assert patient_refreshed.get("managingOrganization") is None
 
-    @pytest.mark.asyncio()
     async def test_update_patch_without_id(self):
         patient = self.client.resource(
-            "Patient", identifier=self.identifier, name=[{"text": "J London"}]
+            "Patient", identifier=IDENTIFIER, name=[{"text": "J London"}]
         )
         new_name = [
             {
@@ -954,14 +872,13 @@ class TestLibAsyncCase:
             await patient.save(fields=["name"])
         await patient.save()
 
-    @pytest.mark.asyncio()
     async def test_update(self):
         patient_id = "patient_to_update"
         patient_initial = await self.create_resource(
             "Patient", id=patient_id, name=[{"text": "J London"}], active=False
         )
         patient_updated = self.client.resource(
-            "Patient", id=patient_id, identifier=self.identifier, active=True
+            "Patient", id=patient_id, identifier=IDENTIFIER, active=True
         )
         await patient_updated.update()
 
@@ -972,7 +889,6 @@ class TestLibAsyncCase:
         assert patient_initial.get("name") is None
         assert patient_initial["active"] is True
 
-    @pytest.mark.asyncio()
     async def test_patch(self):
         patient_id = "patient_to_patch"
         patient_instance_1 = await self.create_resource(
@@ -1000,7 +916,6 @@ class TestLibAsyncCase:
         assert patient_instance_1_refreshed["name"] == new_name
         assert patient_instance_1_refreshed.get("managingOrganization") is None
 
-    @pytest.mark.asyncio()
     async def test_refresh(self):
         patient_id = "refresh-patient-id"
         patient = await self.create_resource("Patient", id=patient_id, active=True)
@@ -1012,7 +927,6 @@ class TestLibAsyncCase:
         await patient.refresh()
         assert patient.serialize() == test_patient.serialize()
 
-    @pytest.mark.asyncio()
     async def test_client_execute_lastn(self):
         patient = await self.create_resource("Patient", name=[{"text": "John First"}])
         observation = await self.create_resource(
@@ -1041,7 +955,6 @@ class TestLibAsyncCase:
         assert response["total"] == 1
         assert response["entry"][0]["resource"]["id"] == observation["id"]
 
-    @pytest.mark.asyncio()
     async def test_searchset_execute_lastn(self):
         patient = await self.create_resource("Patient", name=[{"text": "John First"}])
         observation = await self.create_resource(
@@ -1070,7 +983,6 @@ class TestLibAsyncCase:
         assert response["total"] == 1
         assert response["entry"][0]["resource"]["id"] == observation["id"]
 
-    @pytest.mark.asyncio()
     async def test_resource_execute_lastn(self):
         patient = await self.create_resource("Patient", name=[{"text": "John First"}])
         observation = await self.create_resource(
@@ -1097,7 +1009,6 @@ class TestLibAsyncCase:
         assert response["total"] == 1
         assert response["entry"][0]["resource"]["id"] == observation["id"]
 
-    @pytest.mark.asyncio()
     async def test_client_execute_history(self):
         patient = await self.create_resource("Patient", name=[{"text": "John First"}])
         response = await self.client.execute(f"Patient/{patient.id}/_history", "get")
@@ -1105,7 +1016,6 @@ class TestLibAsyncCase:
         assert response["type"] == "history"
         assert "entry" in response
 
-    @pytest.mark.asyncio()
     async def test_resource_execute_history(self):
         patient = await self.create_resource("Patient", name=[{"text": "John First"}])
         response = await patient.execute("_history", "get")
@@ -1114,7 +1024,6 @@ class TestLibAsyncCase:
         assert response["total"] == 1
         assert "entry" in response
 
-    @pytest.mark.asyncio()
     async def test_reference_execute_history(self):
         patient = await self.create_resource("Patient", name=[{"text": "John First"}])
         patient_ref = patient.to_reference()
@@ -1124,16 +1033,16 @@ class TestLibAsyncCase:
         assert response["total"] == 1
         assert "entry" in response
 
-    @pytest.mark.asyncio()
     async def test_reference_execute_history_not_local(self):
         patient_ref = self.client.reference(reference="http://external.com/Patient/p1")
         with pytest.raises(ResourceNotFound):
             await patient_ref.execute("_history", "get")
 
-    @pytest.mark.asyncio()
     async def test_references_after_save(self):
-        patient = await self.create_resource("Patient", name=[{"text": "John First"}])
-        practitioner = await self.create_resource("Practitioner", name=[{"text": "Jack"}])
+        patient, practitioner = await asyncio.gather(
+            self.create_resource("Patient", name=[{"text": "John First"}]),
+            self.create_resource("Practitioner", name=[{"text": "Jack"}]),
+        )
         appointment = self.client.resource(
             "Appointment",
             **{
@@ -1147,18 +1056,20 @@ class TestLibAsyncCase:
         await appointment.save()
         assert isinstance(appointment.participant[0].actor, AsyncFHIRReference)
         assert isinstance(appointment.participant[0], AttrDict)
-        test_patient = await appointment.participant[0].actor.to_resource()
-        assert test_patient
-
         assert isinstance(appointment.participant[1].actor, AsyncFHIRReference)
         assert isinstance(appointment.participant[1], AttrDict)
-        test_practitioner = await appointment.participant[1].actor.to_resource()
+
+        test_patient, test_practitioner = await asyncio.gather(
+            *[participant.actor.to_resource() for participant in appointment.participant]
+        )
+        assert test_patient
         assert test_practitioner
 
-    @pytest.mark.asyncio()
     async def test_references_in_resource(self):
-        patient = await self.create_resource("Patient", name=[{"text": "John First"}])
-        practitioner = await self.create_resource("Practitioner", name=[{"text": "Jack"}])
+        patient, practitioner = await asyncio.gather(
+            self.create_resource("Patient", name=[{"text": "John First"}]),
+            self.create_resource("Practitioner", name=[{"text": "Jack"}]),
+        )
         appointment = self.client.resource(
             "Appointment",
             **{
@@ -1176,15 +1087,15 @@ class TestLibAsyncCase:
 
         assert isinstance(test_appointment.participant[0].actor, AsyncFHIRReference)
         assert isinstance(test_appointment.participant[0], AttrDict)
-        test_patient = await test_appointment.participant[0].actor.to_resource()
-        assert test_patient
-
         assert isinstance(test_appointment.participant[1].actor, AsyncFHIRReference)
         assert isinstance(test_appointment.participant[1], AttrDict)
-        test_practitioner = await test_appointment.participant[1].actor.to_resource()
+
+        test_patient, test_practitioner = await asyncio.gather(
+            *[participant.actor.to_resource() for participant in test_appointment.participant]
+        )
+        assert test_patient
         assert test_practitioner
 
-    @pytest.mark.asyncio()
     async def test_types_fetch_all(self):
         patients_count = 18
         name = "Jack Johnson J"
@@ -1193,12 +1104,11 @@ class TestLibAsyncCase:
 
         patients = await patient_set.fetch_all()
 
-        received_ids = {p.id for p in patients}
+        received_ids = set(map(attrgetter("id"), patients))
         assert len(received_ids) == patients_count
         assert patient_ids == received_ids
         assert isinstance(patients[0], Patient)
 
-    @pytest.mark.asyncio()
     async def test_typed_fetch(self):
         patients_count = 18
         limit = 5
@@ -1208,11 +1118,10 @@ class TestLibAsyncCase:
 
         patients = await patient_set.fetch()
 
-        received_ids = {p.id for p in patients}
+        received_ids = set(map(attrgetter("id"), patients))
         assert len(received_ids) == limit
         assert isinstance(patients[0], Patient)
 
-    @pytest.mark.asyncio()
     async def test_typed_get(self):
         name = "Jack Johnson J"
         await self.create_test_patients(1, name)
@@ -1222,7 +1131,6 @@ class TestLibAsyncCase:
 
         assert isinstance(patient, Patient)
 
-    @pytest.mark.asyncio()
     async def test_typed_first(self):
         name = "Jack Johnson J"
         await self.create_test_patients(1, name)
@@ -1232,13 +1140,12 @@ class TestLibAsyncCase:
 
         assert isinstance(patient, Patient)
 
-    @pytest.mark.asyncio()
     async def test_typed_get_or_create(self):
         name = "Jack Johnson J"
         await self.create_test_patients(1, name)
         new_patient = Patient(
             name=[HumanName(text=name)],
-            identifier=[Identifier(system="url", value="value"), Identifier(**self.identifier[0])],
+            identifier=[URL_IDENTIFIER, IDENTIFIER_MODEL],
         )
 
         patient, created = (
@@ -1247,16 +1154,15 @@ class TestLibAsyncCase:
 
         assert created is False
         assert isinstance(patient, Patient)
-        assert patient.identifier[0].system == self.identifier[0]["system"]
-        assert patient.identifier[0].value == self.identifier[0]["value"]
+        assert patient.identifier[0].system == IDENTIFIER[0]["system"]
+        assert patient.identifier[0].value == IDENTIFIER[0]["value"]
 
-    @pytest.mark.asyncio()
     async def test_typed_update(self):
         name = "Jack Johnson J"
         await self.create_test_patients(1, name)
         new_patient = Patient(
             name=[HumanName(text=name)],
-            identifier=[Identifier(system="url", value="value"), Identifier(**self.identifier[0])],
+            identifier=[URL_IDENTIFIER, IDENTIFIER_MODEL],
         )
 
         patient, created = (
@@ -1267,10 +1173,9 @@ class TestLibAsyncCase:
         assert isinstance(patient, Patient)
         assert patient.identifier[0].system == "url"
         assert patient.identifier[0].value == "value"
-        assert patient.identifier[1].system == self.identifier[0]["system"]
-        assert patient.identifier[1].value == self.identifier[0]["value"]
+        assert patient.identifier[1].system == IDENTIFIER[0]["system"]
+        assert patient.identifier[1].value == IDENTIFIER[0]["value"]
 
-    @pytest.mark.asyncio()
     async def test_typed_patch(self):
         name = "Jack Johnson J"
         await self.create_test_patients(1, name)
@@ -1282,8 +1187,8 @@ class TestLibAsyncCase:
                 identifier=[
                     x.model_dump(exclude_none=True)
                     for x in [
-                        Identifier(system="url", value="value"),
-                        Identifier(**self.identifier[0]),
+                        URL_IDENTIFIER,
+                        IDENTIFIER_MODEL,
                     ]
                 ],
             )
@@ -1292,26 +1197,174 @@ class TestLibAsyncCase:
         assert isinstance(patient, Patient)
         assert patient.identifier[0].system == "url"
         assert patient.identifier[0].value == "value"
-        assert patient.identifier[1].system == self.identifier[0]["system"]
-        assert patient.identifier[1].value == self.identifier[0]["value"]
+        assert patient.identifier[1].system == IDENTIFIER[0]["system"]
+        assert patient.identifier[1].value == IDENTIFIER[0]["value"]
+
+
+def test_to_reference_for_resource_without_id():
+    client = AsyncFHIRClient(FHIR_SERVER_URL)
+    resource = client.resource("Patient")
+    with pytest.raises(ResourceNotFound):
+        resource.to_reference()
+
+
+def test_build_request_url():
+    client = AsyncFHIRClient(FHIR_SERVER_URL)
+    url = f"{FHIR_SERVER_URL}/Patient?_count=100&name=ivan&name=petrov"
+    request_url = client._build_request_url(url, None)
+    assert request_url == url
+
+
+def test_build_request_url_relative_path():
+    client = AsyncFHIRClient("http://example.com/fhir/")
+    assert (
+        client._build_request_url("/fhir/Patient", {"name": "ivan"})
+        == "http://example.com/fhir/Patient?name=ivan"
+    )
+
+
+def test_build_request_url_wrong_path():
+    client = AsyncFHIRClient(FHIR_SERVER_URL)
+    url = "https://example.com/Patient?_count=100&name=ivan&name=petrov"
+    with pytest.raises(ValueError):  # noqa: PT011
+        client._build_request_url(url, None)
 
 
-@pytest.mark.asyncio()
 async def test_aiohttp_config():
     client = AsyncFHIRClient(
         FHIR_SERVER_URL,
         authorization=FHIR_SERVER_AUTHORIZATION,
         aiohttp_config={"ssl": False, "proxy": "http://example.com"},
     )
-    resp = MockAiohttpResponse(
-        bytes(
-            json.dumps({"resourceType": "Bundle", "type": "searchset", "total": 0, "entry": []}),
-            "utf-8",
-        ),
-        200,
-    )
+    resp = MockAiohttpResponse(EMPTY_BUNDLE, 200)
     with patch("aiohttp.ClientSession.request", return_value=resp) as patched_request:
         await client.resources("Patient").first()
         patched_request.assert_called_with(
-            ANY, ANY, json=None, ssl=False, proxy="http://example.com"
+            ANY, ANY, data=None, headers=ANY, ssl=False, proxy="http://example.com"
         )
+    await client.close()
+
+
+async def test_aiohttp_config_headers():
+    client = AsyncFHIRClient(
+        FHIR_SERVER_URL,
+        extra_headers={"X-Client": "client", "X-Trace": "client"},
+        aiohttp_config={"headers": {"X-Trace": "1"}},
+    )
+    resp = MockAiohttpResponse(EMPTY_BUNDLE, 200)
+    with patch("aiohttp.ClientSession.request", return_value=resp) as patched_request:
+        await client.resources("Patient").first()
+
+    headers = patched_request.call_args.kwargs["headers"]
+    assert headers["X-Client"] == "client"
+    assert headers["X-Trace"] == "1"
+    assert client.aiohttp_config == {"headers": {"X-Trace": "1"}}
+
+
+@pytest.mark.parametrize(
+    ("extra_headers", "content_type"),
+    [
+        (None, "application/json"),
+        ({"content-type": "application/fhir+json"}, "application/fhir+json"),
+    ],
+)
+async def test_request_content_type(extra_headers, content_type):
+    client = AsyncFHIRClient(FHIR_SERVER_URL, extra_headers=extra_headers)
+    resp = MockAiohttpResponse(json_dumps({"resourceType": "Patient", "id": "p1"}), 201)
+    with patch("aiohttp.ClientSession.request", return_value=resp) as patched_request:
+        await client.resource("Patient").create()
+
+    headers = CIMultiDict(patched_request.call_args.kwargs["headers"])
+    assert headers.getall("Content-Type") == [content_type]
+
+
+async def test_context_manager_closes_session():
+    async with AsyncFHIRClient(FHIR_SERVER_URL) as client:
+        session = client._session
+        assert not session.closed
+
+    assert session.closed
+    assert client._session is None
+
+
+async def test_session_per_request_without_context_manager():
+    client = AsyncFHIRClient(FHIR_SERVER_URL)
+    resp = MockAiohttpResponse(EMPTY_BUNDLE, 200)
+    with patch("aiohttp.ClientSession.request", autospec=True, return_value=resp) as patched:
+        await client.resources("Patient").first()
+
+    session = patched.call_args.args[0]
+    assert session.closed
+    assert client._session is None
+
+
+def test_session_used_from_another_loop():
+    client = AsyncFHIRClient(FHIR_SERVER_URL)
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(client.__aenter__())
+        with pytest.raises(RuntimeError):
+            asyncio.run(client.resources("Patient").first())
+    finally:
+        loop.run_until_complete(client.close())
+        loop.close()
+
+
+async def test_connector_config():
+    async with AsyncFHIRClient(
+        FHIR_SERVER_URL, connector_config={"limit": 8, "limit_per_host": 4}
+    ) as client:
+        connector = client._session.connector
+        assert connector.limit == 8  # noqa: PLR2004
+        assert connector.limit_per_host == 4  # noqa: PLR2004
+
+
+def fake_paginated_fetch_resource(events, page_sizes):
+    async def fetch_resource(path, params=None):
+        page = int(params["page"][0]) if params else 1
+        events.append(f"fetch {page}")
+        return {
+            "resourceType": "Bundle",
+            "type": "searchset",
+            "link": [{"relation": "next", "url": f"/Patient?page={page + 1}"}]
+            if page < len(page_sizes)
+            else [],
+            "entry": [
+                {"resource": {"resourceType": "Patient", "id": f"{page}-{index}"}}
+                for index in range(page_sizes[page - 1])
+            ],
+        }
+
+    return fetch_resource
+
+
+async def test_async_for_iterator_prefetches_next_page():
+    events = []
+    fetch_resource = fake_paginated_fetch_resource(events, [3, 0, 3, 1])
+
+    async with AsyncFHIRClient(FHIR_SERVER_URL) as client:
+        with patch.object(client, "_fetch_resource", side_effect=fetch_resource):
+            async for patient in client.resources("Patient"):
+                events.append(patient.id)
+                # Consumer work that gives the prefetched request a chance to run
+                await asyncio.sleep(0)
+
+    assert events == [
+        *("fetch 1", "1-0", "1-1", "fetch 2", "1-2"),
+        *("fetch 3", "3-0", "3-1", "fetch 4", "3-2"),
+        "4-0",
+    ]
+
+
+async def test_async_for_iterator_early_break_does_not_prefetch():
+    events = []
+    fetch_resource = fake_paginated_fetch_resource(events, [3, 3])
+
+    async with AsyncFHIRClient(FHIR_SERVER_URL) as client:
+        with patch.object(client, "_fetch_resource", side_effect=fetch_resource):
+            async for patient in client.resources("Patient"):
+                events.append(patient.id)
+                break
+            await asyncio.sleep(0)
+
+    assert events == ["fetch 1", "1-0"]
@@ -1,8 +1,10 @@
 from typing import Union
+from unittest.mock import patch
 
 import pytest
 
 from fhirpy import AsyncFHIRClient, SyncFHIRClient
+from fhirpy.base.exceptions import ResourceNotFound
 from fhirpy.base.utils import AttrDict, SearchList, parse_pagination_url, set_by_path
 from fhirpy.lib import BaseFHIRReference
 
@@ -83,6 +85,32 @@ class TestLibBase:
             ],
         }
 
+    def test_serialize_with_unsaved_nested_resource_failed(
+        self, client: Union[SyncFHIRClient, AsyncFHIRClient]
+    ):
+        patient = client.resource(
+            "Patient",
+            id="patient",
+            generalPractitioner=[client.resource("Practitioner")],
+        )
+
+        with pytest.raises(ResourceNotFound):
+            patient.serialize()
+
+    def test_serialize_nested_resource_uses_to_reference(
+        self, client: Union[SyncFHIRClient, AsyncFHIRClient]
+    ):
+        practitioner = client.resource("Practitioner", id="pr1")
+        patient = client.resource("Patient", id="patient", generalPractitioner=[practitioner])
+
+        def to_reference(resource, **kwargs):
+            return client.reference(reference=resource.reference, display="Doctor")
+
+        with patch.object(type(practitioner), "to_reference", to_reference):
+            assert patient.serialize()["generalPractitioner"] == [
+                {"reference": "Practitioner/pr1", "display": "Doctor"}
+            ]
+
     def test_equality(self, client: Union[SyncFHIRClient, AsyncFHIRClient]):
         resource = client.resource("Patient", id="p1")
         reference = client.reference("Patient", "p1")
@@ -257,6 +285,16 @@ class TestLibBase:
         patient.name[0].given.append("Hellen")
         assert patient["name"][0]["given"] == ["Firstname", "Hellen"]
 
+    def test_accessing_missing_property_failed(
+        self, client: Union[SyncFHIRClient, AsyncFHIRClient]
+    ):
+        patient = client.resource("Patient", id="patient")
+        with pytest.raises(AttributeError):
+            patient.gender  # noqa: B018
+        with pytest.raises(AttributeError):
+            patient["gender"]
+        assert not hasattr(patient, "__dict__")
+
     def test_pluggable_type_model_resource_instantiation(
         self, client: Union[SyncFHIRClient, AsyncFHIRClient]
     ):
@@ -1,9 +1,12 @@
 import json
+from operator import attrgetter
 from typing import ClassVar
 from unittest.mock import ANY, patch
 
 import pytest
+import requests
 import responses
+from requests.adapters import HTTPAdapter
 
 from fhirpy import SyncFHIRClient
 from fhirpy.base.exceptions import (
@@ -17,50 +20,96 @@ from fhirpy.lib import SyncFHIRReference, SyncFHIRResource
 
 from .config import FHIR_SERVER_AUTHORIZATION, FHIR_SERVER_URL
 from .types import HumanName, Identifier, Patient, Reference
-from .utils import MockRequestsResponse, dump_resource
+from .utils import (
+    EMPTY_BUNDLE,
+    IDENTIFIER,
+    IDENTIFIER_MODEL,
+    URL_IDENTIFIER,
+    MockRequestsResponse,
+    dump_resource,
+)
 
 
 class TestLibSyncCase:
     URL = FHIR_SERVER_URL
     client = None
-    identifier: ClassVar = [{"system": "http://example.com/env", "value": "fhirpy"}]
+    search_sets: ClassVar[dict] = {}
+    session = None
+    # Model templates are validated once, created patients are rebuilt from the response
+    patient_name: ClassVar = (HumanName(text="My patient"),)
+    patient_identifier: ClassVar = (
+        Identifier(system=IDENTIFIER[0]["system"], value=IDENTIFIER[0]["system"]),
+    )
 
     @classmethod
     def get_search_set(cls, resource_type):
-        return cls.client.resources(resource_type).search(**{"identifier": "fhirpy"})
+        return cls.search_sets[resource_type]
+
+    @classmethod
+    def _delete_matches(cls, search_set):
+        try:
+            # Conditional delete removes zero or one match in a single request
+            search_set.delete()
+        except MultipleResourcesFound:
+            return search_set.fetch_all()
+        return []
 
     @classmethod
     @pytest.fixture(autouse=True)
     def _clear_db(cls):
-        for resource_type in ["Patient", "Practitioner"]:
-            search_set = cls.get_search_set(resource_type)
-            for item in search_set:
-                item.delete()
+        entry = [
+            {"request": {"method": "DELETE", "url": f"{item.resourceType}/{item.id}"}}
+            for search_set in cls.search_sets.values()
+            for item in cls._delete_matches(search_set)
+        ]
+        if entry:
+            cls.client.resource("Bundle", type="batch", entry=entry).create()
 
     @classmethod
     def setup_class(cls):
+        cls.session = requests.Session()
+        # All requests go to the single FHIR server origin
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32)
+        cls.session.mount("http://", adapter)
+        cls.session.mount("https://", adapter)
         cls.client = SyncFHIRClient(
             cls.URL,
             authorization=FHIR_SERVER_AUTHORIZATION,
             extra_headers={"Access-Control-Allow-Origin": "*"},
             dump_resource=dump_resource,
+            session=cls.session,
         )
+        cls.search_sets = {
+            resource_type: cls.client.resources(resource_type).search(identifier="fhirpy")
+            for resource_type in ["Patient", "Practitioner"]
+        }
+
+    @classmethod
+    def teardown_class(cls):
+        cls.session.close()
 
     def create_resource(self, resource_type, **kwargs):
-        return self.client.resource(resource_type, identifier=self.identifier, **kwargs).create()
+        return self.client.resource(resource_type, identifier=IDENTIFIER, **kwargs).create()
+
+    def create_resources(self, resource_type, *resources):
+        entry = [
+            {
+                "request": {"method": "POST", "url": f"/{resource_type}"},
+                "resource": {
+                    "resourceType": resource_type,
+                    "identifier": IDENTIFIER,
+                    **resource,
+                },
+            }
+            for resource in resources
+        ]
+        self.client.resource("Bundle", type="transaction", entry=entry).create()
+
+    def build_patient_model(self, **kwargs):
+        return Patient(name=self.patient_name, identifier=self.patient_identifier, **kwargs)
 
     def create_patient_model(self, **kwargs):
-        patient = Patient(
-            name=[HumanName(text="My patient")],
-            identifier=[
-                Identifier(
-                    system=self.identifier[0]["system"],
-                    value=self.identifier[0]["system"],
-                )
-            ],
-            **kwargs,
-        )
-        return self.client.create(patient)
+        return self.client.create(self.build_patient_model(**kwargs))
 
     def test_create_patient_model(self):
         patient = self.create_patient_model()
@@ -74,8 +123,8 @@ class TestLibSyncCase:
             name=[HumanName(text="My patient")],
             identifier=[
                 Identifier(
-                    system=self.identifier[0]["system"],
-                    value=self.identifier[0]["system"],
+                    system=IDENTIFIER[0]["system"],
+                    value=IDENTIFIER[0]["system"],
                 )
             ],
         )
@@ -88,7 +137,7 @@ class TestLibSyncCase:
         patient = self.create_patient_model()
         patient.identifier = [
             *patient.identifier,
-            Identifier(system="url", value="value"),
+            URL_IDENTIFIER,
         ]
 
         updated_patient = self.client.update(patient)
@@ -98,8 +147,7 @@ class TestLibSyncCase:
         assert len(updated_patient.identifier) == 2  # noqa: PLR2004
 
     def test_client_update_fails_without_id(self):
-        patient = self.create_patient_model()
-        patient.id = None
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             self.client.update(patient)
@@ -109,8 +157,8 @@ class TestLibSyncCase:
             name=[HumanName(text="My patient")],
             identifier=[
                 Identifier(
-                    system=self.identifier[0]["system"],
-                    value=self.identifier[0]["system"],
+                    system=IDENTIFIER[0]["system"],
+                    value=IDENTIFIER[0]["system"],
                 )
             ],
         )
@@ -123,7 +171,7 @@ class TestLibSyncCase:
         patient = self.create_patient_model()
         patient.identifier = [
             *patient.identifier,
-            Identifier(system="url", value="value"),
+            URL_IDENTIFIER,
         ]
 
         updated_patient = self.client.save(patient)
@@ -139,7 +187,7 @@ class TestLibSyncCase:
 
         patient.identifier = [
             *patient.identifier,
-            Identifier(system="url", value="value"),
+            URL_IDENTIFIER,
         ]
         patient.name[0].text = "New patient"
         patient.managingOrganization = None
@@ -153,8 +201,7 @@ class TestLibSyncCase:
         assert updated_patient.managingOrganization is None
 
     def test_client_save_partial_update_fails_without_id(self):
-        patient = self.create_patient_model()
-        patient.id = None
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             self.client.save(patient, fields=["identifier"])
@@ -188,7 +235,7 @@ class TestLibSyncCase:
         assert isinstance(fetched_patient, Patient)
 
     def test_client_get_specifying_resource_type_fails_without_id(self):
-        patient = self.create_patient_model()
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             self.client.get(patient.resourceType)
@@ -197,7 +244,7 @@ class TestLibSyncCase:
         patient = self.create_patient_model(
             managingOrganization=Reference(reference="urn:organization")
         )
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = self.client.patch(
             f"{patient.resourceType}/{patient.id}",
@@ -213,7 +260,7 @@ class TestLibSyncCase:
 
     def test_client_patch_specifying_resource_type_str_and_id(self):
         patient = self.create_patient_model()
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = self.client.patch(
             patient.resourceType,
@@ -226,7 +273,7 @@ class TestLibSyncCase:
 
     def test_client_patch_specifying_resource_type_type_and_id(self):
         patient = self.create_patient_model()
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = self.client.patch(
             Patient,
@@ -239,7 +286,7 @@ class TestLibSyncCase:
 
     def test_client_patch_specifying_resource_type_type_and_ref(self):
         patient = self.create_patient_model()
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = self.client.patch(
             Patient,
@@ -252,7 +299,7 @@ class TestLibSyncCase:
 
     def test_client_patch_specifying_resource(self):
         patient = self.create_patient_model()
-        new_identifier = [*patient.identifier, Identifier(system="url", value="value")]
+        new_identifier = [*patient.identifier, URL_IDENTIFIER]
 
         patched_patient = self.client.patch(
             patient, identifier=[x.model_dump(exclude_none=True) for x in new_identifier]
@@ -262,14 +309,13 @@ class TestLibSyncCase:
         assert len(patched_patient.identifier) == 2  # noqa: PLR2004
 
     def test_client_patch_specifying_resource_type_fails_without_id(self):
-        patient = self.create_patient_model()
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             self.client.patch(patient.resourceType)
 
     def test_client_patch_specifying_resource_fails_without_id(self):
-        patient = self.create_patient_model()
-        patient.id = None
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             self.client.patch(patient)
@@ -279,50 +325,44 @@ class TestLibSyncCase:
 
         self.client.delete(f"{patient.resourceType}/{patient.id}")
 
-        fetched_patient = self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert self.client.resources(Patient).search(_id=patient.id).count() == 0
 
     def test_client_delete_specifying_resource_type_str_and_id(self):
         patient = self.create_patient_model()
 
         self.client.delete(patient.resourceType, patient.id)
 
-        fetched_patient = self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert self.client.resources(Patient).search(_id=patient.id).count() == 0
 
     def test_client_delete_specifying_resource_type_type_and_id(self):
         patient = self.create_patient_model()
 
         self.client.delete(Patient, patient.id)
 
-        fetched_patient = self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert self.client.resources(Patient).search(_id=patient.id).count() == 0
 
     def test_client_delete_specifying_resource_type_type_and_ref(self):
         patient = self.create_patient_model()
 
         self.client.delete(Patient, f"Patient/{patient.id}")
 
-        fetched_patient = self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert self.client.resources(Patient).search(_id=patient.id).count() == 0
 
     def test_client_delete_specifying_resource(self):
         patient = self.create_patient_model()
 
         self.client.delete(patient)
 
-        fetched_patient = self.client.resources(Patient).search(_id=patient.id).first()
-        assert fetched_patient is None
+        assert self.client.resources(Patient).search(_id=patient.id).count() == 0
 
     def test_client_delete_specifying_resource_type_fails_without_id(self):
-        patient = self.create_patient_model()
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             self.client.delete(patient.resourceType)
 
     def test_client_delete_specifying_resource_fails_without_id(self):
-        patient = self.create_patient_model()
-        patient.id = None
+        patient = self.build_patient_model()
 
         with pytest.raises(TypeError):
             self.client.delete(patient)
@@ -338,7 +378,7 @@ class TestLibSyncCase:
 
         patient = self.client.resource(
             "Patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
             name=[{"text": "Indiana Jones"}],
         )
         patient.create(identifier="other")
@@ -350,29 +390,26 @@ class TestLibSyncCase:
         existing_patient = self.create_resource("Patient", id="patient")
 
         patient = self.client.resource(
-            "Patient", identifier=self.identifier, name=[{"text": "Indiana Jones"}]
+            "Patient", identifier=IDENTIFIER, name=[{"text": "Indiana Jones"}]
         )
         patient.create(identifier="fhirpy")
 
         assert patient.id == "patient"
         assert patient.get("name") is None
-        assert patient.get_by_path(["meta", "versionId"]) == existing_patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patient["meta"]["versionId"] == existing_patient["meta"]["versionId"]
 
     def test_conditional_create__fail_on_multiple_matches(self):
-        self.create_resource("Patient", id="patient-one")
-        self.create_resource("Patient", id="patient-two")
+        self.create_resources("Patient", {"id": "patient-one"}, {"id": "patient-two"})
 
         with pytest.raises(MultipleResourcesFound):
-            self.client.resource("Patient", identifier=self.identifier).create(identifier="fhirpy")
+            self.client.resource("Patient", identifier=IDENTIFIER).create(identifier="fhirpy")
 
     def test_get_or_create__create_on_no_match(self):
         self.create_resource("Patient", id="patient")
 
         patient_to_save = self.client.resource(
             "Patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
             name=[{"text": "Indiana Jones"}],
         )
         patient, created = (
@@ -387,7 +424,7 @@ class TestLibSyncCase:
     def test_get_or_create__skip_on_one_match(self):
         existing_patient = self.create_resource("Patient", id="patient")
 
-        patient_to_save = self.client.resource("Patient", identifier=self.identifier)
+        patient_to_save = self.client.resource("Patient", identifier=IDENTIFIER)
         patient, created = (
             self.client.resources("Patient")
             .search(identifier="fhirpy")
@@ -395,15 +432,12 @@ class TestLibSyncCase:
         )
         assert patient.id == "patient"
         assert created is False
-        assert patient.get_by_path(["meta", "versionId"]) == existing_patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patient["meta"]["versionId"] == existing_patient["meta"]["versionId"]
 
     def test_conditional_operations__fail_on_multiple_matches(self):
-        self.create_resource("Patient", id="patient-one")
-        self.create_resource("Patient", id="patient-two")
+        self.create_resources("Patient", {"id": "patient-one"}, {"id": "patient-two"})
 
-        patient_to_save = self.client.resource("Patient", identifier=self.identifier)
+        patient_to_save = self.client.resource("Patient", identifier=IDENTIFIER)
         with pytest.raises(MultipleResourcesFound):
             self.client.resources("Patient").search(identifier="fhirpy").get_or_create(
                 patient_to_save
@@ -418,7 +452,7 @@ class TestLibSyncCase:
 
         patient_to_update = self.client.resource(
             "Patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
             active=False,
         )
         new_patient, created = (
@@ -435,28 +469,24 @@ class TestLibSyncCase:
         patient = self.create_resource("Patient", id="patient", active=True)
 
         patient_to_update = self.client.resource(
-            "Patient", identifier=self.identifier, name=[{"text": "Indiana Jones"}]
+            "Patient", identifier=IDENTIFIER, name=[{"text": "Indiana Jones"}]
         )
         updated_patient, created = (
             self.client.resources("Patient").search(identifier="fhirpy").update(patient_to_update)
         )
         assert updated_patient.id == patient.id
         assert created is False
-        assert updated_patient.get_by_path(["meta", "versionId"]) != patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert updated_patient["meta"]["versionId"] != patient["meta"]["versionId"]
         assert updated_patient.get_by_path(["name", 0, "text"]) == "Indiana Jones"
 
         patient.refresh()
-        assert updated_patient.get_by_path(["meta", "versionId"]) == patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert updated_patient["meta"]["versionId"] == patient["meta"]["versionId"]
         assert patient.get("active") is None
 
     def test_conditional_patch__no_match(self):
         patient_to_patch = self.client.resource(
             "Patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
             active=False,
         )
         with pytest.raises(ResourceNotFound):
@@ -474,22 +504,18 @@ class TestLibSyncCase:
             self.client.resources("Patient")
             .search(identifier="fhirpy")
             .patch(
-                identifier=self.identifier,
+                identifier=IDENTIFIER,
                 name=[{"text": "Indiana Jones"}],
                 managingOrganization=None,
             )
         )
         assert patched_patient.id == patient.id
-        assert patched_patient.get_by_path(["meta", "versionId"]) != patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patched_patient["meta"]["versionId"] != patient["meta"]["versionId"]
         assert patched_patient.get_by_path(["name", 0, "text"]) == "Indiana Jones"
         assert patched_patient.get("managingOrganization") is None
 
         patient.refresh()
-        assert patched_patient.get_by_path(["meta", "versionId"]) == patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patched_patient["meta"]["versionId"] == patient["meta"]["versionId"]
         assert patient.active is True
         assert patient.get("managingOrganization") is None
 
@@ -497,21 +523,17 @@ class TestLibSyncCase:
         patient = self.create_resource("Patient", id="patient", active=True)
 
         patient_to_patch = self.client.resource(
-            "Patient", identifier=self.identifier, name=[{"text": "Indiana Jones"}]
+            "Patient", identifier=IDENTIFIER, name=[{"text": "Indiana Jones"}]
         )
         patched_patient = (
             self.client.resources("Patient").search(identifier="fhirpy").patch(patient_to_patch)
         )
         assert patched_patient.id == patient.id
-        assert patched_patient.get_by_path(["meta", "versionId"]) != patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patched_patient["meta"]["versionId"] != patient["meta"]["versionId"]
         assert patched_patient.get_by_path(["name", 0, "text"]) == "Indiana Jones"
 
         patient.refresh()
-        assert patched_patient.get_by_path(["meta", "versionId"]) == patient.get_by_path(
-            ["meta", "versionId"]
-        )
+        assert patched_patient["meta"]["versionId"] == patient["meta"]["versionId"]
         assert patient.active is True
 
     def test_update_patient(self):
@@ -573,7 +595,7 @@ class TestLibSyncCase:
         patient = self.client.resource(
             "Patient",
             id="patient",
-            identifier=[{"system": "http://example.com/env", "value": "other"}, self.identifier[0]],
+            identifier=[{"system": "http://example.com/env", "value": "other"}, IDENTIFIER[0]],
         )
         patient.save()
 
@@ -584,8 +606,7 @@ class TestLibSyncCase:
         assert status_code == 200  # noqa: PLR2004
 
     def test_conditional_delete__multiple_matches(self):
-        self.create_resource("Patient", id="patient-1")
-        self.create_resource("Patient", id="patient-2")
+        self.create_resources("Patient", {"id": "patient-1"}, {"id": "patient-2"})
 
         with pytest.raises(MultipleResourcesFound):
             self.client.resources("Patient").search(identifier="fhirpy").delete()
@@ -595,8 +616,7 @@ class TestLibSyncCase:
             self.client.resources("Patient").search(_id="FHIRPypy_not_existing_id").get()
 
     def test_get_more_than_one_resources(self):
-        self.create_resource("Patient", birthDate="1901-05-25")
-        self.create_resource("Patient", birthDate="1905-05-25")
+        self.create_resources("Patient", {"birthDate": "1901-05-25"}, {"birthDate": "1905-05-25"})
         with pytest.raises(MultipleResourcesFound):
             self.client.resources("Patient").get()
         with pytest.raises(MultipleResourcesFound):
@@ -616,8 +636,11 @@ class TestLibSyncCase:
             self.client.resources("Patient").search(gender="female", _id="patient").get()
 
     def test_get_resource_by_search(self):
-        self.create_resource("Patient", id="patient1", gender="male", birthDate="1901-05-25")
-        self.create_resource("Patient", id="patient2", gender="female", birthDate="1905-05-25")
+        self.create_resources(
+            "Patient",
+            {"id": "patient1", "gender": "male", "birthDate": "1901-05-25"},
+            {"id": "patient2", "gender": "female", "birthDate": "1905-05-25"},
+        )
         patient_1 = (
             self.client.resources("Patient").search(gender="male", birthdate="1901-05-25").get()
         )
@@ -687,18 +710,9 @@ class TestLibSyncCase:
             "entry": [
                 {
                     "request": {"method": "POST", "url": "/Patient"},
-                    "resource": {
-                        "id": "bundle_patient_1",
-                        "identifier": self.identifier,
-                    },
-                },
-                {
-                    "request": {"method": "POST", "url": "/Patient"},
-                    "resource": {
-                        "id": "bundle_patient_2",
-                        "identifier": self.identifier,
-                    },
-                },
+                    "resource": {"id": patient_id, "identifier": IDENTIFIER},
+                }
+                for patient_id in ["bundle_patient_1", "bundle_patient_2"]
             ],
         }
         self.create_resource("Bundle", **bundle)
@@ -721,15 +735,19 @@ class TestLibSyncCase:
         assert resource("Patient", gender="female", custom_prop="123").is_valid() is False
 
     def test_get_first(self):
-        self.create_resource("Patient", id="patient_first", name=[{"text": "Abc"}])
-        self.create_resource("Patient", id="patient_second", name=[{"text": "Bbc"}])
+        self.create_resources(
+            "Patient",
+            {"id": "patient_first", "name": [{"text": "Abc"}]},
+            {"id": "patient_second", "name": [{"text": "Bbc"}]},
+        )
         patient = self.client.resources("Patient").sort("name").first()
         assert isinstance(patient, SyncFHIRResource)
         assert patient.id == "patient_first"
 
     def test_fetch_raw(self):
-        self.create_resource("Patient", name=[{"text": "RareName"}])
-        self.create_resource("Patient", name=[{"text": "RareName"}])
+        self.create_resources(
+            "Patient", {"name": [{"text": "RareName"}]}, {"name": [{"text": "RareName"}]}
+        )
         bundle = self.client.resources("Patient").search(name="RareName").fetch_raw()
         assert bundle.resourceType == "Bundle"
         for entry in bundle.entry:
@@ -737,8 +755,9 @@ class TestLibSyncCase:
         assert len(bundle.entry) == 2  # noqa: PLR2004
 
     def test_typed_fetch_raw(self):
-        self.create_resource("Patient", name=[{"text": "RareName"}])
-        self.create_resource("Patient", name=[{"text": "RareName"}])
+        self.create_resources(
+            "Patient", {"name": [{"text": "RareName"}]}, {"name": [{"text": "RareName"}]}
+        )
         bundle = self.client.resources(Patient).search(name="RareName").fetch_raw()
         assert bundle.resourceType == "Bundle"
         for entry in bundle.entry:
@@ -746,25 +765,11 @@ class TestLibSyncCase:
         assert len(bundle.entry) == 2  # noqa: PLR2004
 
     def create_test_patients(self, count=10, name="Not Rare Name"):
-        bundle = {
-            "type": "transaction",
-            "entry": [],
-        }
-        patient_ids = set()
-        for i in range(count):
-            p_id = f"patient-{i}"
-            patient_ids.add(p_id)
-            bundle["entry"].append(
-                {
-                    "request": {"method": "POST", "url": "/Patient"},
-                    "resource": {
-                        "id": p_id,
-                        "name": [{"text": f"{name}{i}"}],
-                        "identifier": self.identifier,
-                    },
-                }
-            )
-        self.create_resource("Bundle", **bundle)
+        patient_ids = {f"patient-{i}" for i in range(count)}
+        self.create_resources(
+            "Patient",
+            *[{"id": f"patient-{i}", "name": [{"text": f"{name}{i}"}]} for i in range(count)],
+        )
         return patient_ids
 
     def test_fetch_all(self):
@@ -775,7 +780,7 @@ class TestLibSyncCase:
 
         patients = patient_set.fetch_all()
 
-        received_ids = {p.id for p in patients}
+        received_ids = set(map(attrgetter("id"), patients))
 
         assert len(received_ids) == patients_count
         assert patient_ids == received_ids
@@ -784,7 +789,8 @@ class TestLibSyncCase:
         patients_count = 22
         name = "Rob Robinson R"
         patient_ids = self.create_test_patients(patients_count, name)
-        patient_set = self.client.resources("Patient").search(name=name).limit(3)
+        # Only ids are checked, so the server returns thin resources
+        patient_set = self.client.resources("Patient").search(name=name).elements("id").limit(3)
 
         received_ids = set()
         for patient in patient_set:
@@ -805,6 +811,38 @@ class TestLibSyncCase:
         with pytest.raises(InvalidResponse):
             patients.fetch()
 
+    @responses.activate
+    def test_first_skips_included_resources(self):
+        responses.add(
+            responses.GET,
+            self.URL + "/Patient",
+            json={
+                "resourceType": "Bundle",
+                "entry": [
+                    {"resource": {"resourceType": "Practitioner", "id": "pr1"}},
+                    {"resource": {"resourceType": "Patient", "id": "p1"}},
+                ],
+            },
+            status=200,
+        )
+        patient = (
+            self.client.resources("Patient").include("Patient", "general-practitioner").first()
+        )
+        assert isinstance(patient, SyncFHIRResource)
+        assert patient.id == "p1"
+
+    @responses.activate
+    def test_get_by_id_reads_resource(self):
+        responses.add(
+            responses.GET,
+            self.URL + "/Patient/p1",
+            json={"resourceType": "Patient", "id": "p1"},
+            status=200,
+        )
+        patient = self.client.resources("Patient").search(_id="p1").get()
+        assert isinstance(patient, SyncFHIRResource)
+        assert patient.id == "p1"
+
     @responses.activate
     def test_client_headers(self):
         patients = self.client.resources("Patient")
@@ -844,7 +882,7 @@ class TestLibSyncCase:
 
     def test_update_patch_without_id(self):
         patient = self.client.resource(
-            "Patient", identifier=self.identifier, name=[{"text": "J London"}]
+            "Patient", identifier=IDENTIFIER, name=[{"text": "J London"}]
         )
         new_name = [
             {
@@ -868,7 +906,7 @@ class TestLibSyncCase:
             "Patient", id=patient_id, name=[{"text": "J London"}], active=False
         )
         patient_updated = self.client.resource(
-            "Patient", id=patient_id, identifier=self.identifier, active=True
+            "Patient", id=patient_id, identifier=IDENTIFIER, active=True
         )
         patient_updated.update()
 
@@ -1105,7 +1143,7 @@ class TestLibSyncCase:
 
         patients = patient_set.fetch_all()
 
-        received_ids = {p.id for p in patients}
+        received_ids = set(map(attrgetter("id"), patients))
         assert len(received_ids) == patients_count
         assert patient_ids == received_ids
         assert isinstance(patients[0], Patient)
@@ -1119,7 +1157,7 @@ class TestLibSyncCase:
 
         patients = patient_set.fetch()
 
-        received_ids = {p.id for p in patients}
+        received_ids = set(map(attrgetter("id"), patients))
         assert len(received_ids) == limit
         assert isinstance(patients[0], Patient)
 
@@ -1146,7 +1184,7 @@ class TestLibSyncCase:
         self.create_test_patients(1, name)
         new_patient = Patient(
             name=[HumanName(text=name)],
-            identifier=[Identifier(system="url", value="value"), Identifier(**self.identifier[0])],
+            identifier=[URL_IDENTIFIER, IDENTIFIER_MODEL],
         )
 
         patient, created = (
@@ -1155,15 +1193,15 @@ class TestLibSyncCase:
 
         assert created is False
         assert isinstance(patient, Patient)
-        assert patient.identifier[0].system == self.identifier[0]["system"]
-        assert patient.identifier[0].value == self.identifier[0]["value"]
+        assert patient.identifier[0].system == IDENTIFIER[0]["system"]
+        assert patient.identifier[0].value == IDENTIFIER[0]["value"]
 
     def test_typed_update(self):
         name = "Jack Johnson J"
         self.create_test_patients(1, name)
         new_patient = Patient(
             name=[HumanName(text=name)],
-            identifier=[Identifier(system="url", value="value"), Identifier(**self.identifier[0])],
+            identifier=[URL_IDENTIFIER, IDENTIFIER_MODEL],
         )
 
         patient, created = self.client.resources(Patient).search(name=name).update(new_patient)
@@ -1172,8 +1210,8 @@ class TestLibSyncCase:
         assert isinstance(patient, Patient)
         assert patient.identifier[0].system == "url"
         assert patient.identifier[0].value == "value"
-        assert patient.identifier[1].system == self.identifier[0]["system"]
-        assert patient.identifier[1].value == self.identifier[0]["value"]
+        assert patient.identifier[1].system == IDENTIFIER[0]["system"]
+        assert patient.identifier[1].value == IDENTIFIER[0]["value"]
 
     def test_typed_patch(self):
         name = "Jack Johnson J"
@@ -1186,8 +1224,8 @@ class TestLibSyncCase:
                 identifier=[
                     x.model_dump(exclude_none=True)
                     for x in [
-                        Identifier(system="url", value="value"),
-                        Identifier(**self.identifier[0]),
+                        URL_IDENTIFIER,
+                        IDENTIFIER_MODEL,
                     ]
                 ],
             )
@@ -1196,8 +1234,8 @@ class TestLibSyncCase:
         assert isinstance(patient, Patient)
         assert patient.identifier[0].system == "url"
         assert patient.identifier[0].value == "value"
-        assert patient.identifier[1].system == self.identifier[0]["system"]
-        assert patient.identifier[1].value == self.identifier[0]["value"]
+        assert patient.identifier[1].system == IDENTIFIER[0]["system"]
+        assert patient.identifier[1].value == IDENTIFIER[0]["value"]
 
 
 def test_requests_config():
@@ -1206,12 +1244,84 @@ def test_requests_config():
         authorization=FHIR_SERVER_AUTHORIZATION,
         requests_config={"verify": False, "cert": "some_cert"},
     )
-    json_resp_str = json.dumps(
-        {"resourceType": "Bundle", "type": "searchset", "total": 0, "entry": []}
-    )
-    resp = MockRequestsResponse(bytes(json_resp_str, "utf-8"), 200)
-    with patch("requests.request", return_value=resp) as patched_request:
+    resp = MockRequestsResponse(EMPTY_BUNDLE, 200)
+    with patch("requests.Session.request", return_value=resp) as patched_request:
         client.resources("Patient").first()
         patched_request.assert_called_with(
-            ANY, ANY, json=ANY, headers=ANY, verify=False, cert="some_cert"
+            ANY, ANY, data=ANY, headers=ANY, verify=False, cert="some_cert"
         )
+
+
+def test_custom_session():
+    session = requests.Session()
+    client = SyncFHIRClient(FHIR_SERVER_URL, session=session)
+    resp = MockRequestsResponse(EMPTY_BUNDLE, 200)
+    with patch.object(session, "request", return_value=resp) as patched_request, patch.object(
+        session, "close"
+    ) as patched_close:
+        client.resources("Patient").first()
+        client.close()
+
+        patched_request.assert_called_once()
+        patched_close.assert_not_called()
+
+
+@responses.activate
+def test_save_fields_serializes_only_requested_fields():
+    client = SyncFHIRClient(FHIR_SERVER_URL)
+    responses.add(
+        responses.PATCH,
+        FHIR_SERVER_URL + "/Patient/p1",
+        json={"resourceType": "Patient", "id": "p1"},
+        status=200,
+    )
+    patient = client.resource(
+        "Patient", id="p1", active=None, gender="male", name=[{"text": "Name"}], address=[]
+    )
+
+    patient.save(fields=["active", "gender"])
+
+    assert json.loads(responses.calls[0].request.body) == {"active": None, "gender": "male"}
+    with pytest.raises(KeyError):
+        patient.save(fields=["birthDate"])
+    with pytest.raises(KeyError):
+        patient.save(fields=["address"])
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    ("extra_headers", "content_type"),
+    [
+        (None, "application/json"),
+        ({"content-type": "application/fhir+json"}, "application/fhir+json"),
+    ],
+)
+def test_request_content_type(extra_headers, content_type):
+    client = SyncFHIRClient(FHIR_SERVER_URL, extra_headers=extra_headers)
+    responses.add(
+        responses.POST,
+        FHIR_SERVER_URL + "/Patient",
+        json={"resourceType": "Patient", "id": "p1"},
+        status=201,
+    )
+
+    client.resource("Patient").create()
+
+    assert responses.calls[0].request.headers["Content-Type"] == content_type
+
+
+@responses.activate
+def test_server_cookies_are_not_kept():
+    client = SyncFHIRClient(FHIR_SERVER_URL, requests_config={"cookies": {"user": "cookie"}})
+    responses.add(
+        responses.GET,
+        FHIR_SERVER_URL + "/Patient/p1",
+        json={"resourceType": "Patient", "id": "p1"},
+        headers={"Set-Cookie": "session=server; Path=/"},
+    )
+
+    client.get("Patient", "p1")
+    client.get("Patient", "p1")
+
+    assert len(client._session.cookies) == 0
+    assert responses.calls[1].request.headers["Cookie"] == "user=cookie"
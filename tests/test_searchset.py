@@ -22,6 +22,11 @@ class TestSearchSet:
             "birth-date": ["2010-01-01"],
         }
 
+    def test_search_does_not_mutate_original(self, client: Union[SyncFHIRClient, AsyncFHIRClient]):
+        search_set = client.resources("Patient").search(name="John")
+        search_set.search(name="Smith")
+        assert search_set.params == {"name": ["John"]}
+
     def test_sort(self, client: Union[SyncFHIRClient, AsyncFHIRClient]):
         search_set = client.resources("Patient").sort("id").sort("deceased")
         assert search_set.params == {"_sort": ["deceased"]}
@@ -33,13 +38,7 @@ class TestSearchSet:
     def test_elements(self, client: Union[SyncFHIRClient, AsyncFHIRClient]):
         search_set = client.resources("Patient").elements("deceased").elements("gender")
 
-        assert set(search_set.params.keys()) == {"_elements"}
-        assert len(search_set.params["_elements"]) == 1
-        assert set(search_set.params["_elements"][0].split(",")) == {
-            "id",
-            "resourceType",
-            "gender",
-        }
+        assert search_set.params == {"_elements": ["gender,id,resourceType"]}
 
     def test_elements_exclude(self, client: Union[SyncFHIRClient, AsyncFHIRClient]):
         search_set = client.resources("Patient").elements("name", exclude=True)
@@ -165,3 +164,13 @@ class TestSearchSet:
 
     def test_str(self, client: Union[SyncFHIRClient, AsyncFHIRClient]):
         assert "FHIRSearchSet Patient?_id=id" in str(client.resources("Patient").search(_id="id"))
+
+    def test_get_id_for_read(self, client: Union[SyncFHIRClient, AsyncFHIRClient]):
+        search_set = client.resources("Patient")
+        assert search_set._get_id_for_read(search_set.search(_id="p1").limit(2).params) == "p1"
+        assert search_set._get_id_for_read(search_set.search(_id="p1,p2").params) is None
+        assert (
+            search_set._get_id_for_read(search_set.search(_id="p1", gender="male").params) is None
+        )
+        assert search_set._get_id_for_read(search_set.search(_id="../p1").params) is None
+        assert search_set._get_id_for_read(search_set.limit(2).params) is None
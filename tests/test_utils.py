@@ -1,13 +1,33 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from enum import Enum
 from typing import Literal
+from uuid import UUID
 
 import pytest
 from pydantic import BaseModel
 
+from fhirpy.base import utils
 from fhirpy.base.resource_protocol import (
     get_resource_type_from_class,
     get_resource_type_id_and_class,
 )
-from fhirpy.base.utils import clean_empty_values, remove_nulls_from_dicts
+from fhirpy.base.utils import (
+    AttrDict,
+    clean_empty_values,
+    clean_values,
+    json_dumps,
+    remove_nulls_from_dicts,
+)
+
+
+class Gender(Enum):
+    FEMALE = "female"
+
+
+@dataclass
+class HumanNameData:
+    text: object
 
 
 def test_get_resource_type_from_class_for_pydantic_model_value():
@@ -24,6 +44,17 @@ def test_get_resource_type_from_class_for_pydantic_model_annotation():
     assert get_resource_type_from_class(PatientResource) == "PatientResource"
 
 
+def test_get_resource_type_from_class_is_cached():
+    class PatientResource(BaseModel):
+        resourceType: Literal["PatientResource"]  # noqa: N815
+
+    get_resource_type_from_class(PatientResource)
+    hits = get_resource_type_from_class.cache_info().hits
+
+    assert get_resource_type_from_class(PatientResource) == "PatientResource"
+    assert get_resource_type_from_class.cache_info().hits == hits + 1
+
+
 class Patient(BaseModel):
     resourceType: Literal["Patient"] = "Patient"  # noqa: N815
     id: str
@@ -64,6 +95,26 @@ def test_get_resource_type_id_and_class_for_ref():
     )
 
 
+def test_attr_dict_attribute_access():
+    data = AttrDict(resourceType="Patient")
+    data.id = "patient"
+    assert data == {"resourceType": "Patient", "id": "patient"}
+    assert data.resourceType == "Patient"
+
+    del data.id
+    assert "id" not in data
+    assert not hasattr(data, "id")
+    with pytest.raises(AttributeError):
+        del data.id
+
+
+def test_attr_dict_keys_shadow_dict_methods():
+    data = AttrDict(items=2, copy="copy", get=None)
+    assert data.items == 2  # noqa: PLR2004
+    assert data.copy == "copy"
+    assert data.get is None
+
+
 def test_remove_nulls_from_dicts():
     assert remove_nulls_from_dicts({}) == {}
     assert remove_nulls_from_dicts({"item": []}) == {"item": []}
@@ -84,3 +135,61 @@ def test_clean_empty_values():
     assert clean_empty_values({"item": [None, {"item": None}, {}]}) == {
         "item": [None, {"item": None}, None]
     }
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"str": ""},
+        {"item": [None, {"item": None}, {}]},
+        {"item": [{"nested": {"item": None}}, [], [None]]},
+        {"nested": {"nested2": [{}]}, "empty": {"item": None}},
+    ],
+)
+def test_clean_values(data):
+    assert clean_values(data) == clean_empty_values(remove_nulls_from_dicts(data))
+    assert clean_values(data, drop_nulls_from_dicts=False) == clean_empty_values(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"resourceType": "Patient", "name": [{"text": "Иван"}], "active": True},
+        {"resourceType": "Parameters", "parameter": [{1: "int key", None: "null key"}]},
+        {
+            "birthDate": date(2020, 1, 1),
+            "meta": {"lastUpdated": datetime(2020, 1, 1, 1, 2, 3, 456, tzinfo=timezone.utc)},
+            "time": time(1, 2, 3),
+            "id": UUID(int=1),
+            "gender": Gender.FEMALE,
+            "name": HumanNameData(text="Name"),
+            "value": 1.5,
+            "active": None,
+        },
+    ],
+)
+def test_json_dumps_without_orjson(monkeypatch: pytest.MonkeyPatch, data):
+    serialized = json_dumps(data)
+
+    monkeypatch.setattr(utils, "orjson", None)
+
+    assert json_dumps(data) == serialized
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    ("data", "error"),
+    [
+        ({"value": float("nan")}, ValueError),
+        ({"value": [None, float("inf")]}, ValueError),
+        ({"name": HumanNameData(text=float("-inf"))}, ValueError),
+        ({"value": object()}, TypeError),
+    ],
+)
+def test_json_dumps_errors(monkeypatch: pytest.MonkeyPatch, use_orjson, data, error):
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    with pytest.raises(error):
+        json_dumps(data)
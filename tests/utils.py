@@ -2,6 +2,17 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from fhirpy.base.utils import json_dumps
+
+from .types import Identifier
+
+EMPTY_BUNDLE = json_dumps({"resourceType": "Bundle", "type": "searchset", "total": 0, "entry": []})
+
+IDENTIFIER = [{"system": "http://example.com/env", "value": "fhirpy"}]
+# The constants are shared by the tests, which never mutate them
+IDENTIFIER_MODEL = Identifier(**IDENTIFIER[0])
+URL_IDENTIFIER = Identifier(system="url", value="value")
+
 
 class MockAiohttpResponse:
     def __init__(self, text, status):
@@ -11,6 +22,9 @@ class MockAiohttpResponse:
     async def text(self):
         return self._text
 
+    async def read(self):
+        return self._text if isinstance(self._text, bytes) else self._text.encode()
+
     async def __aexit__(self, exc_type, exc, tb):
         pass
 